@@ -1,13 +1,28 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from langchain_ollama import OllamaLLM
 from config.targets import get_target_config
 
 BATCH_SIZE = 10
+# Batches sent to Ollama at once; the server queues anything above its
+# own OLLAMA_NUM_PARALLEL
+MAX_CONCURRENT_BATCHES = 4
+# How long Ollama keeps the model loaded after a request, so scraper runs a
+# few minutes apart do not reload it
+OLLAMA_KEEP_ALIVE = "15m"
+
+
+@lru_cache(maxsize=8)
+def _get_llm(model: str) -> OllamaLLM:
+    """One client per model for the whole process, so its HTTP keep-alive
+    connections are reused across batches and pipeline runs."""
+    return OllamaLLM(model=model, temperature=0.1, keep_alive=OLLAMA_KEEP_ALIVE)
 
 
 class OllamaBrain:
     def __init__(self, target_customer: str, model: str = "llama3:8b"):
-        self.llm = OllamaLLM(model=model, temperature=0.1)
+        self.llm = _get_llm(model)
         self.target_customer = target_customer
         self.config = get_target_config(target_customer)
         
@@ -69,16 +84,25 @@ Return [] only if ALL accounts are spam/bots."""
         user_map = {u["username"]: u for u in users}
         
         # Process in batches to avoid token limits
-        all_filtered = []
-        total_batches = (len(users) + BATCH_SIZE - 1) // BATCH_SIZE
+        batches = list(enumerate(
+            (users[i:i + BATCH_SIZE] for i in range(0, len(users), BATCH_SIZE)), 1
+        ))
         
-        for i in range(0, len(users), BATCH_SIZE):
-            batch = users[i:i + BATCH_SIZE]
-            batch_num = (i // BATCH_SIZE) + 1
-            print(f"    Processing batch {batch_num}/{total_batches} ({len(batch)} accounts)...")
-            
-            filtered = self._filter_batch(batch)
-            all_filtered.extend(filtered)
+        def run_batch(numbered: tuple[int, list[dict]]) -> list[dict]:
+            # Logged when the batch actually starts, not when it is queued
+            batch_num, batch = numbered
+            print(f"    Processing batch {batch_num}/{len(batches)} ({len(batch)} accounts)...")
+            return self._filter_batch(batch)
+        
+        # Each batch is an independent HTTP round-trip to Ollama, so they run
+        # side by side; map() keeps the results in batch order
+        all_filtered = []
+        if len(batches) == 1:
+            all_filtered.extend(run_batch(batches[0]))
+        else:
+            with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_BATCHES, len(batches))) as pool:
+                for filtered in pool.map(run_batch, batches):
+                    all_filtered.extend(filtered)
         
         # Deduplicate and merge source info
         seen = set()
@@ -7,19 +7,31 @@ Run with:  uvicorn api.main:app --host 0.0.0.0 --port 8000 --reload
 
 import sys
 import os
+import asyncio
+from contextlib import asynccontextmanager
 
 # Ensure the project root is on sys.path so all existing modules resolve
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 
 from api.routers import session, brain, scraper, scrolling, search
 from api.shared.models import (
-    get_task, list_all_tasks, stop_task,
+    get_task, list_all_tasks_bytes, stop_task, run_log_flusher, task_json_bytes,
     TaskStatus, TaskInfo, TaskResponse,
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Drain task log rings into TaskInfo.logs off the workers' hot path
+    flusher = asyncio.create_task(run_log_flusher())
+    yield
+    flusher.cancel()
+
+
 app = FastAPI(
     title="Instagram RPA Automation API",
     description=(
@@ -28,6 +40,7 @@ app = FastAPI(
         "**Scrolling Automation**, and **Search & Explore**."
     ),
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS – allow all in dev; tighten for production
@@ -57,7 +70,7 @@ async def health_check():
 @app.get("/tasks", response_model=list[TaskInfo], tags=["Tasks"])
 async def get_all_tasks():
     """List every background task and its current status."""
-    return list_all_tasks()
+    return Response(content=list_all_tasks_bytes(), media_type="application/json")
 
 
 @app.get("/tasks/{task_id}", response_model=TaskInfo, tags=["Tasks"])
@@ -67,7 +80,7 @@ async def get_task_status(task_id: str):
     if not task:
         from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="Task not found")
-    return task
+    return Response(content=task_json_bytes(task), media_type="application/json")
 
 
 @app.post("/tasks/{task_id}/stop", response_model=TaskResponse, tags=["Tasks"])
@@ -136,7 +136,6 @@ async def get_target_detail(target_key: str):
 def _scrape_worker(task_id: str, target_customer: str, user_id: int,
                    headless: bool, max_commenters: int, model: str, browser_type: str):
     """Run the full async scraper + Ollama analysis + CSV export."""
-    import asyncio
     log = make_log_fn(task_id)
     update_task(task_id, status=TaskStatus.RUNNING)
     log(f"Starting scraper pipeline – target={target_customer}, model={model}, browser={browser_type}")
@@ -158,6 +157,7 @@ def _scrape_worker(task_id: str, target_customer: str, user_id: int,
                 max_commenters=max_commenters,
                 browser_type=browser_type,
                 cookies=cookies,
+                log_callback=log,
             )
             scraped = await scraper.run_session()
             log(f"Scraped {len(scraped)} raw accounts")
@@ -187,7 +187,8 @@ def _scrape_worker(task_id: str, target_customer: str, user_id: int,
             log(f"Error: {e}")
             update_task(task_id, status=TaskStatus.FAILED, message=str(e))
 
-    asyncio.run(_run())
+    from browser.launcher import run_async
+    run_async(_run())
 
 
 @router.post("/run", response_model=TaskResponse)
@@ -119,6 +119,7 @@ def _scraper_scroll_worker(task_id: str, user_id: int, duration: int,
             search_chance=search_chance,
             profile_scroll_count=(profile_scroll_min, profile_scroll_max),
             browser_type=browser_type,
+            user_id=user_id,
         )
         update_task(task_id, status=TaskStatus.COMPLETED, message="Scraper-scroll session finished")
     except Exception as e:
@@ -129,7 +130,7 @@ def _scraper_scroll_worker(task_id: str, user_id: int, duration: int,
 def _csv_visit_worker(task_id: str, user_id: int, csv_path: str,
                       headless: bool, scroll_min: int, scroll_max: int,
                       delay_min: int, delay_max: int, like_chance: float,
-                      browser_type: str):
+                      browser_type: str, concurrency: int = 1):
     log = make_log_fn(task_id)
     stop = make_stop_fn(task_id)
     update_task(task_id, status=TaskStatus.RUNNING)
@@ -148,6 +149,7 @@ def _csv_visit_worker(task_id: str, user_id: int, csv_path: str,
             delay_between_profiles=(delay_min, delay_max),
             like_chance=like_chance,
             browser_type=browser_type,
+            concurrency=concurrency,
         )
         update_task(task_id, status=TaskStatus.COMPLETED, message="CSV visit session finished")
     except Exception as e:
@@ -238,7 +240,7 @@ async def start_csv_profile_visit(req: CSVProfileVisitRequest, bg: BackgroundTas
         task.task_id, req.user_id, req.csv_path,
         req.headless, req.scroll_count_min, req.scroll_count_max,
         req.delay_min, req.delay_max, req.like_chance,
-        req.browser_type,
+        req.browser_type, req.concurrency,
     )
     return TaskResponse(
         task_id=task.task_id, status="accepted",
@@ -16,7 +16,8 @@ router = APIRouter(prefix="/search", tags=["Search & Explore"])
 
 
 def _search_worker(task_id: str, user_id: int, search_term: str,
-                   search_type: str, headless: bool, keep_open: bool, browser_type: str):
+                   search_type: str, headless: bool, keep_open: bool, browser_type: str,
+                   human_typing: bool = True):
     log = make_log_fn(task_id)
     stop = make_stop_fn(task_id)
     update_task(task_id, status=TaskStatus.RUNNING)
@@ -40,6 +41,7 @@ def _search_worker(task_id: str, user_id: int, search_term: str,
             keep_open=keep_open,
             headless=headless,
             browser_type=browser_type,
+            human_typing=human_typing,
         )
         update_task(task_id, status=TaskStatus.COMPLETED, message=f"Search for '{search_term}' completed")
     except Exception as e:
@@ -52,8 +54,9 @@ async def run_search(req: SearchRequest, bg: BackgroundTasks):
     """
     Open Instagram and perform a human-like search for a hashtag or username.
 
-    The browser types the term character-by-character with random delays,
-    then clicks the first matching result. If `keep_open` is true the browser
+    The browser types the term character-by-character with random delays
+    (or fills it in one step with `human_typing: false`), then clicks the
+    first matching result. If `keep_open` is true the browser
     stays open until you call `POST /tasks/{task_id}/stop`.
     """
     task = create_task(f"Search – {req.search_term}")
@@ -61,6 +64,7 @@ async def run_search(req: SearchRequest, bg: BackgroundTasks):
         _search_worker,
         task.task_id, req.user_id, req.search_term,
         req.search_type, req.headless, req.keep_open, req.browser_type,
+        req.human_typing,
     )
     return TaskResponse(
         task_id=task.task_id, status="accepted",
@@ -29,11 +29,15 @@ def get_supabase() -> Client:
 
 # ── Password helpers ────────────────────────────────────────────────
 
+def _digest(salt: str, password: str) -> str:
+    """SHA-256 of ``salt:password``, UTF-8 encoded."""
+    return hashlib.sha256(f"{salt}:{password}".encode()).hexdigest()
+
+
 def _hash_password(password: str) -> str:
     """Hash a password with a random salt using SHA-256."""
     salt = secrets.token_hex(16)
-    hashed = hashlib.sha256(f"{salt}:{password}".encode()).hexdigest()
-    return f"{salt}:{hashed}"
+    return f"{salt}:{_digest(salt, password)}"
 
 
 def _verify_password(password: str, password_hash: str) -> bool:
@@ -41,8 +45,7 @@ def _verify_password(password: str, password_hash: str) -> bool:
     if ":" not in password_hash:
         return False
     salt, stored_hash = password_hash.split(":", 1)
-    computed = hashlib.sha256(f"{salt}:{password}".encode()).hexdigest()
-    return secrets.compare_digest(computed, stored_hash)
+    return secrets.compare_digest(_digest(salt, password), stored_hash)
 
 
 # ── Authentication CRUD ─────────────────────────────────────────────
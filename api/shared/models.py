@@ -1,10 +1,16 @@
 """Shared Pydantic models and task manager for all API routers."""
 
-from pydantic import BaseModel, Field
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Literal
 from enum import Enum
+from collections import deque
+import asyncio
+import json
+import operator
+import threading
+import time
 import uuid
-from datetime import datetime
 
 
 # ── Browser type ────────────────────────────────────────────────────
@@ -31,9 +37,58 @@ class TaskInfo(BaseModel):
     logs: list[str] = []
 
 
+_TASK_KEYS = ("task_id", "status", "created_at", "message", "result", "logs")
+_TASK_FIELDS = operator.attrgetter(*_TASK_KEYS)
+
+
+def task_to_dict(task: TaskInfo) -> dict:
+    """Plain-dict view of a task, skipping pydantic's per-field serializer."""
+    return dict(zip(_TASK_KEYS, _TASK_FIELDS(task)))
+
+
+# Raw (timestamp, msg) entries wait in each task's log ring until they are
+# rendered into TaskInfo.logs. Appending to a deque is cheap and thread-safe,
+# so workers never pay for timestamp formatting; the flusher does that in batches.
+LOG_RING_SIZE = 4096
+LOG_FLUSH_INTERVAL = 0.25
+
+
+class TaskStore:
+    """Everything the task manager keeps per task, behind one dict lookup."""
+    __slots__ = ("info", "stop_event", "logs")
+
+    def __init__(self, info: TaskInfo):
+        self.info = info
+        self.stop_event = threading.Event()
+        self.logs: deque = deque(maxlen=LOG_RING_SIZE)
+
+
 # In-memory store for background tasks
-_tasks: dict[str, TaskInfo] = {}
-_stop_flags: dict[str, bool] = {}
+_store: dict[str, TaskStore] = {}
+
+# Bumped on every task mutation; list_all_tasks_bytes() re-renders only
+# when it has moved since the last snapshot.
+_gen = 0
+_snapshot_gen = -1
+_snapshot_bytes: bytes = b"[]"
+
+
+def _bump():
+    global _gen
+    _gen += 1
+
+
+_iso_cache = [-1, ""]
+
+
+def _iso_now() -> str:
+    """Local ISO-8601 timestamp with microseconds; the seconds part is cached."""
+    ns = time.time_ns()
+    sec = ns // 1_000_000_000
+    if sec != _iso_cache[0]:
+        _iso_cache[0] = sec
+        _iso_cache[1] = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec))
+    return f"{_iso_cache[1]}.{(ns % 1_000_000_000) // 1000:06d}"
 
 
 def create_task(description: str = "") -> TaskInfo:
@@ -41,40 +96,114 @@ def create_task(description: str = "") -> TaskInfo:
     task = TaskInfo(
         task_id=task_id,
         status=TaskStatus.PENDING,
-        created_at=datetime.now().isoformat(),
+        created_at=_iso_now(),
         message=description,
     )
-    _tasks[task_id] = task
-    _stop_flags[task_id] = False
+    _store[task_id] = TaskStore(task)
+    _bump()
     return task
 
 
 def get_task(task_id: str) -> Optional[TaskInfo]:
-    return _tasks.get(task_id)
+    entry = _store.get(task_id)
+    if entry is None:
+        return None
+    _flush_entry_logs(entry)
+    return entry.info
 
 
 def update_task(task_id: str, **kwargs):
-    if task_id in _tasks:
-        task = _tasks[task_id]
+    entry = _store.get(task_id)
+    if entry is not None:
+        task = entry.info
         for k, v in kwargs.items():
             setattr(task, k, v)
+        _bump()
 
 
 def add_task_log(task_id: str, msg: str):
-    if task_id in _tasks:
-        _tasks[task_id].logs.append(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+    entry = _store.get(task_id)
+    if entry is not None:
+        entry.logs.append((time.time(), msg))
+        _bump()
+
+
+_prefix_cache = [-1, ""]
+
+
+def _log_prefix(ts: float) -> str:
+    """Return the ``[HH:MM:SS]`` prefix for *ts*, re-rendered once per second."""
+    sec = int(ts)
+    if sec != _prefix_cache[0]:
+        _prefix_cache[0] = sec
+        _prefix_cache[1] = time.strftime("[%H:%M:%S]", time.localtime(sec))
+    return _prefix_cache[1]
+
+
+def _flush_entry_logs(entry: TaskStore):
+    """Move pending ring entries for one task into ``TaskInfo.logs``."""
+    ring = entry.logs
+    if not ring:
+        return
+    logs = entry.info.logs
+    while ring:
+        ts, msg = ring.popleft()
+        logs.append(f"{_log_prefix(ts)} {msg}")
+
+
+def flush_all_logs():
+    for entry in list(_store.values()):
+        _flush_entry_logs(entry)
+
+
+async def run_log_flusher(interval: float = LOG_FLUSH_INTERVAL):
+    """Background coroutine that drains every task's log ring periodically."""
+    while True:
+        flush_all_logs()
+        await asyncio.sleep(interval)
 
 
 def stop_task(task_id: str):
-    _stop_flags[task_id] = True
+    entry = _store.get(task_id)
+    if entry is not None:
+        entry.stop_event.set()
+        _bump()
 
 
 def is_stopped(task_id: str) -> bool:
-    return _stop_flags.get(task_id, False)
+    entry = _store.get(task_id)
+    return entry is not None and entry.stop_event.is_set()
 
 
 def list_all_tasks() -> list[TaskInfo]:
-    return list(_tasks.values())
+    flush_all_logs()
+    return [entry.info for entry in _store.values()]
+
+
+def _json_bytes(payload) -> bytes:
+    # Values json can't encode itself (datetime, set, Path, models in a task
+    # result) go through FastAPI's encoder, as response_model rendering did
+    return json.dumps(
+        payload,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=jsonable_encoder,
+    ).encode("utf-8")
+
+
+def task_json_bytes(task: TaskInfo) -> bytes:
+    """JSON-encoded single task."""
+    return _json_bytes(task_to_dict(task))
+
+
+def list_all_tasks_bytes() -> bytes:
+    """JSON-encoded task list, cached until the next task mutation."""
+    global _snapshot_gen, _snapshot_bytes
+    gen = _gen
+    if gen != _snapshot_gen:
+        _snapshot_bytes = _json_bytes([task_to_dict(t) for t in list_all_tasks()])
+        _snapshot_gen = gen
+    return _snapshot_bytes
 
 
 def make_log_fn(task_id: str):
@@ -93,12 +222,23 @@ def make_stop_fn(task_id: str):
 
 # ── Request / Response Models ───────────────────────────────────────
 
-class SignupRequest(BaseModel):
+class RequestModel(BaseModel):
+    """Base for one-shot request bodies: immutable, unknown keys rejected."""
+    model_config = ConfigDict(frozen=True, extra="forbid", str_strip_whitespace=True)
+
+
+class SignupRequest(RequestModel):
+    # Credentials are used exactly as sent: accounts may have been created
+    # with leading/trailing spaces, which stripping would lock out
+    model_config = ConfigDict(str_strip_whitespace=False)
+
     username: str = Field(..., description="Username for the web app (authentication table)")
     password: str = Field(..., min_length=6, description="Password (min 6 chars)")
 
 
-class LoginRequest(BaseModel):
+class LoginRequest(RequestModel):
+    model_config = ConfigDict(str_strip_whitespace=False)
+
     username: str = Field(..., description="Web-app username")
     password: str = Field(..., description="Password")
 
@@ -109,40 +249,40 @@ class LoginResponse(BaseModel):
     message: str = "Login successful"
 
 
-class SessionRequest(BaseModel):
+class SessionRequest(RequestModel):
     user_id: int = Field(..., description="User id from the authentication table")
     timeout: int = Field(120, description="Seconds to wait for manual Instagram login")
     browser_type: BROWSER_TYPE_CHOICES = Field("chromium", description="Browser engine: chromium, firefox, or webkit")
 
 
-class AnalyzeAccountsRequest(BaseModel):
+class AnalyzeAccountsRequest(RequestModel):
     users: list[dict] = Field(..., description="List of user dicts with at least a 'username' key")
     target_customer: str = Field(..., description="Target customer key, e.g. 'car', 'skincare', 'ideal'")
     model: str = Field("llama3:8b", description="Ollama model name")
 
 
-class ClassifyAccountsRequest(BaseModel):
+class ClassifyAccountsRequest(RequestModel):
     users: list[dict] = Field(..., description="List of user dicts (username, bio, post_summary, etc.)")
     model: str = Field("llama3:8b", description="Ollama model name")
 
 
-class ExportCSVRequest(BaseModel):
+class ExportCSVRequest(RequestModel):
     results: list[dict] = Field(..., description="List of analyzed result dicts")
     target_customer: str = Field(..., description="Target customer key")
     output_dir: str = Field("output", description="Directory to save CSV files")
 
 
-class ValidateCSVRequest(BaseModel):
+class ValidateCSVRequest(RequestModel):
     csv_path: str = Field(..., description="Path to the CSV file to validate")
 
 
-class CreateSampleCSVRequest(BaseModel):
+class CreateSampleCSVRequest(RequestModel):
     output_path: str = Field(..., description="Path to save the sample CSV file")
     target_type: str = Field("hashtag", description="'hashtag' or 'username'")
     samples: Optional[list[str]] = Field(None, description="Custom sample values")
 
 
-class ScrapeRequest(BaseModel):
+class ScrapeRequest(RequestModel):
     user_id: int = Field(..., description="User id from authentication table (cookies loaded from DB)")
     target_customer: str = Field(..., description="Target customer key")
     headless: bool = Field(False, description="Run browser in headless mode (default: visible)")
@@ -151,7 +291,7 @@ class ScrapeRequest(BaseModel):
     browser_type: BROWSER_TYPE_CHOICES = Field("chromium", description="Browser engine: chromium, firefox, or webkit")
 
 
-class ScrollRequest(BaseModel):
+class ScrollRequest(RequestModel):
     user_id: int = Field(..., description="User id from authentication table (cookies loaded from DB)")
     duration: int = Field(60, description="Session duration in seconds")
     headless: bool = Field(False, description="Run browser in headless mode (default: visible)")
@@ -159,7 +299,7 @@ class ScrollRequest(BaseModel):
     browser_type: BROWSER_TYPE_CHOICES = Field("chromium", description="Browser engine: chromium, firefox, or webkit")
 
 
-class CombinedScrollRequest(BaseModel):
+class CombinedScrollRequest(RequestModel):
     user_id: int = Field(..., description="User id from authentication table (cookies loaded from DB)")
     duration: int = Field(60, description="Session duration in seconds")
     headless: bool = Field(False, description="Run browser in headless mode (default: visible)")
@@ -171,7 +311,7 @@ class CombinedScrollRequest(BaseModel):
     browser_type: BROWSER_TYPE_CHOICES = Field("chromium", description="Browser engine: chromium, firefox, or webkit")
 
 
-class ScraperScrollRequest(BaseModel):
+class ScraperScrollRequest(RequestModel):
     user_id: int = Field(..., description="User id from authentication table (cookies loaded from DB)")
     duration: int = Field(60, description="Session duration in seconds")
     headless: bool = Field(False, description="Run browser in headless mode (default: visible)")
@@ -186,7 +326,7 @@ class ScraperScrollRequest(BaseModel):
     browser_type: BROWSER_TYPE_CHOICES = Field("chromium", description="Browser engine: chromium, firefox, or webkit")
 
 
-class CSVProfileVisitRequest(BaseModel):
+class CSVProfileVisitRequest(RequestModel):
     user_id: int = Field(..., description="User id from authentication table (cookies loaded from DB)")
     csv_path: str = Field(..., description="Path to CSV file containing targets to visit")
     headless: bool = Field(False, description="Run browser in headless mode (default: visible)")
@@ -195,16 +335,18 @@ class CSVProfileVisitRequest(BaseModel):
     delay_min: int = Field(5, description="Min seconds delay between profile visits")
     delay_max: int = Field(15, description="Max seconds delay between profile visits")
     like_chance: float = Field(0.10, description="Probability of liking a post while scrolling")
+    concurrency: int = Field(1, ge=1, le=8, description="Number of browsers visiting targets in parallel")
     browser_type: BROWSER_TYPE_CHOICES = Field("chromium", description="Browser engine: chromium, firefox, or webkit")
 
 
-class SearchRequest(BaseModel):
+class SearchRequest(RequestModel):
     user_id: int = Field(..., description="User id from authentication table (cookies loaded from DB)")
     search_term: str = Field(..., description="The term to search for")
     search_type: str = Field("hashtag", description="'hashtag' or 'username'")
     headless: bool = Field(False, description="Run browser in headless mode (default: visible)")
     keep_open: bool = Field(False, description="Keep browser open after search (blocks until stopped)")
     browser_type: BROWSER_TYPE_CHOICES = Field("chromium", description="Browser engine: chromium, firefox, or webkit")
+    human_typing: bool = Field(True, description="Type the term key by key with human-like delays; false fills it in one step")
 
 
 class TaskResponse(BaseModel):
@@ -1,8 +1,15 @@
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import sync_playwright, Locator, Error as PlaywrightError
+from typing import Optional
+from urllib.parse import urlsplit
+import os
 import time
+import queue
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from browser.search_engine import perform_search
 from utils.csv_loader import load_targets_from_csv
+from utils.bloom import BloomFilter
 from browser.scraper_integration import run_scraper_pipeline_sync
 from browser.launcher import (
     BrowserType,
@@ -15,56 +22,178 @@ from browser.scrolling import (
     do_single_scroll,
     try_random_like,
     launch_instagram_browser,
-    run_infinite_mode
+    run_infinite_mode,
+    get_locator,
+    BrowserPool,
+    MAX_LIKE_CANDIDATES,
 )
 
 
+# One shared generator for every random decision in this module
+_rng = random.Random()
+
+# One round-trip per profile scroll: page down, an occasional up/down wiggle
+# and an optional like, all dispatched inside the page. Every random choice
+# is drawn in Python (see _scroll_plan) and passed in.
+SCROLL_AND_MAYBE_LIKE_JS = """
+async ({pause, up, upPause, downPause, like, pick, maxCandidates}) => {
+    const step = () => window.innerHeight * 0.875;
+    const sleep = (ms) => new Promise(r => setTimeout(r, ms));
+    window.scrollBy(0, step());
+    await sleep(pause);
+    if (up) {
+        window.scrollBy(0, -step());
+        await sleep(upPause);
+        window.scrollBy(0, step());
+        await sleep(downPause);
+    }
+    let liked = false;
+    if (like) {
+        // Only hearts currently on screen, capped like try_random_like
+        const hearts = [...document.querySelectorAll('svg[aria-label="Like"]')].filter(svg => {
+            const r = svg.getBoundingClientRect();
+            return r.width > 0 && r.bottom > 0 && r.top < window.innerHeight;
+        }).slice(0, maxCandidates);
+        if (hearts.length) {
+            const heart = hearts[Math.floor(pick * hearts.length)];
+            const target = heart.closest('button, [role="button"]') || heart;
+            target.dispatchEvent(new MouseEvent('click', {bubbles: true, cancelable: true}));
+            liked = true;
+        }
+    }
+    return {liked};
+}
+"""
+
+
+def _scroll_plan(scroll_count, like_chance, up_chance=0.15):
+    """Draw the jitter and like/wiggle decisions for a whole profile scroll run up front."""
+    uniform, rand = _rng.uniform, _rng.random
+    return [
+        {
+            'pause': uniform(800, 1500),
+            'up': rand() < up_chance,
+            'upPause': uniform(300, 600),
+            'downPause': uniform(300, 700),
+            'like': rand() < like_chance,
+            'pick': rand(),
+            'maxCandidates': MAX_LIKE_CANDIDATES,
+        }
+        for _ in range(scroll_count)
+    ]
+
+
+INSTAGRAM_HOST = "www.instagram.com"
+
+HOME_SELECTORS: tuple[str, ...] = (
+    'a[href="/"]',
+    'xpath=//a[@href="/"]',
+    'xpath=//svg[@aria-label="Home"]/ancestor::a',
+    'xpath=//span[text()="Home"]/ancestor::a',
+)
+
+# Follow button only (not "Following" or "Requested")
+FOLLOW_SELECTORS: tuple[str, ...] = (
+    'button:has-text("Follow"):not(:has-text("Following")):not(:has-text("Requested"))',
+    'xpath=//button[.//div[text()="Follow"] and not(.//div[text()="Following"]) and not(.//div[text()="Requested"])]',
+    'xpath=//header//button[contains(text(),"Follow") and not(contains(text(),"Following")) and not(contains(text(),"Requested"))]',
+)
+
+
+# Seconds a side trip needs left in the session before it is started, so a
+# tail explore/scrape/visit does not run far past session_duration
+EXPLORE_MIN_REMAINING = 20
+SCRAPER_MIN_REMAINING = 60
+VISIT_MIN_REMAINING = 30
+
+# Visited-post filters, one file per account and target customer, kept
+# between runs
+VISITED_POSTS_DIR = os.path.join(os.path.expanduser("~"), ".cache", "rpa_backend", "visited_posts")
+VISITED_POSTS_CAPACITY = 50_000
+VISITED_POSTS_ERROR_RATE = 0.001
+
+
+def _visited_posts_path(target_customer: str, user_id: int | None = None) -> str:
+    # Without a user_id (CLI runs) all sessions share one file per target
+    account = "default" if user_id is None else str(user_id)
+    return os.path.join(VISITED_POSTS_DIR, account, f"{target_customer.lower()}.bloom")
+
+
+def _new_visited_posts() -> BloomFilter:
+    return BloomFilter(VISITED_POSTS_CAPACITY, VISITED_POSTS_ERROR_RATE)
+
+
+def _load_visited_posts(path: str, log) -> BloomFilter:
+    """Load the saved filter, or start a new generation once it is full."""
+    visited_posts = BloomFilter.load(path, VISITED_POSTS_CAPACITY, VISITED_POSTS_ERROR_RATE)
+    if visited_posts.full:
+        log(f"♻️ Visited-posts filter reached {len(visited_posts)} posts, starting a new one")
+        return _new_visited_posts()
+    return visited_posts
+
+
+def _find_first(page, selectors: tuple[str, ...]) -> Optional[Locator]:
+    """First visible element matching any of *selectors*, or None.
+
+    CSS and xpath alternatives are OR-ed into one locator and probed with a
+    single count(), so a missing element costs one round-trip rather than
+    an exception per selector.
+    """
+    loc = get_locator(page, selectors).locator("visible=true").first
+    return loc if loc.count() else None
+
+
+def _click_first(page, selectors: tuple[str, ...], timeout=1500) -> bool:
+    loc = _find_first(page, selectors)
+    if loc is None:
+        return False
+    try:
+        loc.click(timeout=timeout)
+        return True
+    except:
+        return False
+
+
+def _is_feed(url: str) -> bool:
+    """True for the main feed URL, with or without a trailing slash or query."""
+    parts = urlsplit(url)
+    return parts.netloc == INSTAGRAM_HOST and parts.path in ("", "/")
+
+
 def go_back_to_feed(page, log=print):
     log("Returning to main feed...")
     try:
-        # natural going back using navigation
+        # natural going back using navigation; go_back returns as soon as the
+        # navigation commits, so we check the URL without a blind sleep per step
+        reached_feed = False
         for i in range(3): 
-            page.go_back()
-            time.sleep(random.uniform(0.5, 1.0))
+            page.go_back(wait_until="commit", timeout=4000)
             
             # Check if we're on the main feed
-            current_url = page.url
-            if current_url == "https://www.instagram.com/" or current_url == "https://www.instagram.com":
+            if _is_feed(page.url):
                 log("Reached main feed via back navigation")
+                reached_feed = True
                 break
         
-        # Wait for page to stabilize
-        try:
-            page.wait_for_load_state('networkidle', timeout=3000)
-        except:
-            pass
-        
-        time.sleep(random.uniform(1.0, 2.0))
+        if reached_feed:
+            # The feed polls continuously, so networkidle would only time out here
+            time.sleep(_rng.uniform(0.3, 0.6))
+        else:
+            # Wait for page to stabilize
+            try:
+                page.wait_for_load_state('networkidle', timeout=3000)
+            except:
+                pass
+            
+            time.sleep(_rng.uniform(1.0, 2.0))
         
         #  try clicking the Home button if navigation didn't work
         current_url = page.url
-        if "instagram.com" in current_url and current_url not in ["https://www.instagram.com/", "https://www.instagram.com"]:
+        if urlsplit(current_url).netloc == INSTAGRAM_HOST and not _is_feed(current_url):
             log("Clicking Home button as fallback...")
-            try:
-                home_selectors = [
-                    'a[href="/"]',
-                    'xpath=//a[@href="/"]',
-                    'xpath=//svg[@aria-label="Home"]/ancestor::a',
-                    'xpath=//span[text()="Home"]/ancestor::a',
-                ]
-                
-                for selector in home_selectors:
-                    try:
-                        home_btn = page.query_selector(selector)
-                        if home_btn and home_btn.is_visible():
-                            home_btn.click()
-                            log("✅ Clicked Home button")
-                            time.sleep(random.uniform(1.5, 2.5))
-                            break
-                    except:
-                        continue
-            except:
-                pass
+            if _click_first(page, HOME_SELECTORS):
+                log("✅ Clicked Home button")
+                time.sleep(_rng.uniform(1.5, 2.5))
         
         # activate scrolling
         try:
@@ -75,7 +204,7 @@ def go_back_to_feed(page, log=print):
     except Exception as e:
         log(f"Back navigation failed: {e}, using direct navigation...")
         page.goto("https://www.instagram.com")
-        time.sleep(random.uniform(2.0, 3.0))
+        time.sleep(_rng.uniform(2.0, 3.0))
 
 
 def scroll_to_top_and_follow(page, username, log=print):
@@ -83,29 +212,19 @@ def scroll_to_top_and_follow(page, username, log=print):
     try:
         log(f"⬆️ Scrolling to top of @{username}'s profile...")
         page.keyboard.press("Home")
-        time.sleep(random.uniform(1.0, 2.0))
+        time.sleep(_rng.uniform(1.0, 2.0))
 
         # Look for the Follow button (not "Following" or "Requested")
-        follow_selectors = [
-            'button:has-text("Follow"):not(:has-text("Following")):not(:has-text("Requested"))',
-            'xpath=//button[.//div[text()="Follow"] and not(.//div[text()="Following"]) and not(.//div[text()="Requested"])]',
-            'xpath=//header//button[contains(text(),"Follow") and not(contains(text(),"Following")) and not(contains(text(),"Requested"))]',
-        ]
-
-        for selector in follow_selectors:
-            try:
-                btn = page.query_selector(selector)
-                if btn and btn.is_visible():
-                    btn_text = btn.inner_text().strip()
-                    # Double-check: only click if the text is exactly "Follow"
-                    if btn_text == "Follow":
-                        time.sleep(random.uniform(0.5, 1.2))
-                        btn.click()
-                        log(f"✅ Followed @{username}!")
-                        time.sleep(random.uniform(1.0, 2.0))
-                        return True
-            except:
-                continue
+        btn = _find_first(page, FOLLOW_SELECTORS)
+        if btn is not None:
+            btn_text = btn.inner_text().strip()
+            # Double-check: only click if the text is exactly "Follow"
+            if btn_text == "Follow":
+                time.sleep(_rng.uniform(0.5, 1.2))
+                btn.click()
+                log(f"✅ Followed @{username}!")
+                time.sleep(_rng.uniform(1.0, 2.0))
+                return True
 
         log(f"⚠️ Follow button not found for @{username} (may already be following)")
         return False
@@ -117,36 +236,23 @@ def scroll_to_top_and_follow(page, username, log=print):
 
 def scroll_on_page(page, scroll_count, should_stop, log=print, like_chance=0.10):
     like_count = 0
+    plan = _scroll_plan(scroll_count, like_chance)
     
     for i in range(scroll_count):
         if should_stop():
             break
             
-        page.press('body', 'PageDown')
-        time.sleep(random.uniform(0.8, 1.5))
+        try:
+            outcome = page.evaluate(SCROLL_AND_MAYBE_LIKE_JS, plan[i])
+        except PlaywrightError as e:
+            # Page navigated away or closed; further scrolls would fail too
+            log(f"Profile scroll stopped: {e}")
+            break
         
-        # Small chance to scroll up 
-        if random.uniform(0, 1) < 0.15:
-            page.press('body', 'PageUp')
-            time.sleep(random.uniform(0.3, 0.6))
-            page.press('body', 'PageDown')
-            time.sleep(random.uniform(0.3, 0.7))
-        
-        # Random like based on like_chance
-        if random.uniform(0, 1) < like_chance:
-            try:
-                like_buttons = page.query_selector_all('svg[aria-label="Like"]')
-                if like_buttons:
-                    random_button = random.choice(like_buttons)
-                    try:
-                        random_button.click(timeout=200)
-                        like_count += 1
-                        log("Liked a post!")
-                        time.sleep(0.5)
-                    except:
-                        pass
-            except:
-                pass
+        if outcome.get('liked'):
+            like_count += 1
+            log("Liked a post!")
+            time.sleep(0.5)
         
         log(f"Profile scroll {i+1}/{scroll_count}")
     
@@ -158,7 +264,7 @@ def perform_search_and_explore(page, search_targets, profile_scroll_count, shoul
         return False
     
     # Pick a random target
-    target = random.choice(search_targets)
+    target = _rng.choice(search_targets)
     is_hashtag = target.startswith('#')
     search_type = "hashtag" if is_hashtag else "username"
     
@@ -173,10 +279,10 @@ def perform_search_and_explore(page, search_targets, profile_scroll_count, shoul
             return False
         
         # Wait to load
-        time.sleep(random.uniform(2.5, 4.0))
+        time.sleep(_rng.uniform(2.5, 4.0))
         
         # Scroll on the profile/hashtag page
-        scroll_count = random.randint(profile_scroll_count[0], profile_scroll_count[1])
+        scroll_count = _rng.randint(profile_scroll_count[0], profile_scroll_count[1])
         log(f"Scrolling {scroll_count} times on {search_type} page...")
         like_count = scroll_on_page(page, scroll_count, should_stop, log)
         log(f"Explored {target} - {scroll_count} scrolls, {like_count} likes")
@@ -195,50 +301,52 @@ def perform_search_and_explore(page, search_targets, profile_scroll_count, shoul
         return False
 
 
-def run_scroll_session(cookies: list[dict], session_duration, should_stop, log, headless, search_targets, search_chance, profile_scroll_count, browser_type: BrowserType = DEFAULT_BROWSER):
-    """Run a single scroll session and return stats."""
-    with sync_playwright() as p:
-        browser, context, page = launch_instagram_browser(p, cookies, headless, log, browser_type=browser_type)
-        
+def run_scroll_session(pool: BrowserPool, session_duration, should_stop, log, search_targets, search_chance, profile_scroll_count):
+    """Run a single scroll session on a page from *pool* and return stats."""
+    page = pool.acquire()
+    try:
         log(f"Starting combined scroll session ({session_duration}s)...")
         if search_targets:
             log(f"Search targets: {', '.join(search_targets)}")
             log(f"Search chance: {int(search_chance * 100)}%")
-        
+
         start_time = time.time()
+        deadline = start_time + session_duration
         scroll_count = 0
         like_count = 0
         explore_count = 0
-        last_explore_time = start_time
         min_time_between_explores = 30
-        
-        while time.time() - start_time < session_duration and not should_stop():
+        next_explore_ok_at = start_time + min_time_between_explores
+
+        while True:
+            now = time.time()
+            if now >= deadline or should_stop():
+                break
             scroll_count += 1
-            elapsed = round(time.time() - start_time, 1)
-            log(f"Scroll #{scroll_count} | {elapsed}s / {session_duration}s | Likes: {like_count} | Explores: {explore_count}")
-            
+            log.debug("Scroll #%d | %.1fs / %ss | Likes: %d | Explores: %d",
+                      scroll_count, now - start_time, session_duration, like_count, explore_count)
+
             did_scroll_up = do_single_scroll(page, log)
             if did_scroll_up:
                 log("Scrolling up (natural behavior)")
-            
+
             if try_random_like(page, log=log):
                 like_count += 1
                 log(f"❤️ Liked a post! (Total: {like_count})")
-            
-            time_since_last_explore = time.time() - last_explore_time
-            if (search_targets and 
-                len(search_targets) > 0 and 
-                time_since_last_explore > min_time_between_explores and
-                random.uniform(0, 1) < search_chance):
-                
+
+            if (search_targets and
+                now >= next_explore_ok_at and
+                deadline - now > EXPLORE_MIN_REMAINING and
+                _rng.random() < search_chance):
+
                 if perform_search_and_explore(page, search_targets, profile_scroll_count, should_stop, log):
                     explore_count += 1
-                    last_explore_time = time.time()
-        
+                    next_explore_ok_at = time.time() + min_time_between_explores
+
         log(f"Session complete: {scroll_count} scrolls, {like_count} likes, {explore_count} explores")
-        log("Closing browser...")
-        context.close()
-        browser.close()
+    finally:
+        log.flush()
+        pool.release(page)
     
     return {'scrolls': scroll_count, 'likes': like_count, 'explores': explore_count}, not should_stop()
 
@@ -268,14 +376,16 @@ def run_combined_scroll(
     if search_targets:
         log(f"Combined Mode: Will randomly explore {len(search_targets)} targets")
     
-    if infinite_mode:
-        def session_runner(session_duration):
-            return run_scroll_session(cookies, session_duration, should_stop, log, headless, search_targets, search_chance, profile_scroll_count, browser_type=browser_type)
-        run_infinite_mode(session_runner, should_stop, log)
-    else:
-        run_scroll_session(cookies, duration, should_stop, log, headless, search_targets, search_chance, profile_scroll_count, browser_type=browser_type)
+    with BrowserPool(cookies, headless, log, browser_type=browser_type) as pool:
+        if infinite_mode:
+            def session_runner(session_duration):
+                return run_scroll_session(pool, session_duration, should_stop, log, search_targets, search_chance, profile_scroll_count)
+            run_infinite_mode(session_runner, should_stop, log)
+        else:
+            run_scroll_session(pool, duration, should_stop, log, search_targets, search_chance, profile_scroll_count)
     
     log("✅ Done!")
+    log.flush()
 
 
 def run_csv_profile_visit(
@@ -288,7 +398,13 @@ def run_csv_profile_visit(
     delay_between_profiles=(5, 15),
     like_chance=0.10,
     browser_type: BrowserType = DEFAULT_BROWSER,
+    concurrency: int = 1,
 ):
+    """
+    Visit every CSV target: search → scroll → maybe like → back to feed.
+    With concurrency > 1 the targets are shared through a queue between
+    that many browsers, each paced on its own.
+    """
     log = create_log_function(log_callback)
     should_stop = create_stop_checker(stop_flag)
     
@@ -301,6 +417,7 @@ def run_csv_profile_visit(
     targets = csv_data['targets']
     target_type = csv_data['type']
     total_count = csv_data['count']
+    concurrency = max(1, min(concurrency, len(targets)))
     
     log(f"\n{'='*50}")
     log(f" CSV PROFILE VISIT MODE")
@@ -310,6 +427,8 @@ def run_csv_profile_visit(
     log(f"Total targets: {total_count}")
     log(f"Scrolls per profile: {scroll_count_range[0]}-{scroll_count_range[1]}")
     log(f"Delay between profiles: {delay_between_profiles[0]}-{delay_between_profiles[1]}s")
+    if concurrency > 1:
+        log(f"Concurrent browsers: {concurrency}")
     log(f"{'='*50}\n")
     
     if headless:
@@ -317,100 +436,128 @@ def run_csv_profile_visit(
     else:
         log("Running with visible browser")
     
-    # Stats tracking
-    visited_count = 0
-    total_likes = 0
-    total_scrolls = 0
+    # Stats tracking, shared by every worker
+    stats = {'visited': 0, 'likes': 0, 'scrolls': 0}
     failed_visits = []
+    stats_lock = threading.Lock()
     
-    with sync_playwright() as p:
-        browser, context, page = launch_instagram_browser(p, cookies, headless, log, browser_type=browser_type)
-        
-        time.sleep(random.uniform(1.0, 2.0))
-        
-        # Visit each target one by one
-        for index, target in enumerate(targets, 1):
-            if should_stop():
-                log("🛑 Stop requested. Ending profile visits...")
-                break
+    # Draw every per-target scroll count and delay up front
+    scroll_counts = [_rng.randint(scroll_count_range[0], scroll_count_range[1]) for _ in targets]
+    delays = [_rng.uniform(delay_between_profiles[0], delay_between_profiles[1]) for _ in targets]
+    
+    pending = queue.Queue()
+    for item in enumerate(targets, 1):
+        pending.put(item)
+    search_type = "hashtag" if target_type == "hashtag" else "username"
+    
+    def visit_worker():
+        with sync_playwright() as p:
+            browser, context, page = launch_instagram_browser(p, cookies, headless, log, browser_type=browser_type)
             
-            log(f"\n{'='*40}")
-            log(f" VISITING {index}/{total_count}: {target}")
-            log(f"{'='*40}")
+            time.sleep(_rng.uniform(1.0, 2.0))
             
-            try:
-                # Perform search for this target
-                search_type = "hashtag" if target_type == "hashtag" else "username"
-                
-                if not perform_search(page, target, search_type, log):
-                    log(f"⚠️ Failed to find: {target}")
-                    failed_visits.append(target)
-                    continue
-                
-                # Wait for profile/hashtag page to load
-                time.sleep(random.uniform(2.5, 4.0))
-                visited_count += 1
-                
-                # Scroll on the profile/hashtag page
-                scroll_count = random.randint(scroll_count_range[0], scroll_count_range[1])
-                log(f" Scrolling {scroll_count} times on {target}...")
-                
-                like_count = scroll_on_page(page, scroll_count, should_stop, log, like_chance)
-                total_likes += like_count
-                total_scrolls += scroll_count
-                
-                log(f" Visited {target} - {scroll_count} scrolls, {like_count} likes")
-                
-                # Return to main feed
-                go_back_to_feed(page, log)
+            # Visit targets until the shared queue runs dry
+            while True:
+                if should_stop():
+                    log("🛑 Stop requested. Ending profile visits...")
+                    break
+                try:
+                    index, target = pending.get_nowait()
+                except queue.Empty:
+                    break
                 
-                # Delay before next profile visit for better simulation
-                if index < total_count and not should_stop():
-                    delay = random.uniform(delay_between_profiles[0], delay_between_profiles[1])
-                    log(f" Waiting {delay:.1f}s before next profile...")
-                    time.sleep(delay)
+                log(f"\n{'='*40}")
+                log(f" VISITING {index}/{total_count}: {target}")
+                log(f"{'='*40}")
                 
-            except Exception as e:
-                log(f"❌ Error visiting {target}: {e}")
-                failed_visits.append(target)
-                # Try to recover by going back to feed
                 try:
+                    # Perform search for this target
+                    if not perform_search(page, target, search_type, log):
+                        log(f"⚠️ Failed to find: {target}")
+                        with stats_lock:
+                            failed_visits.append(target)
+                        continue
+                    
+                    # Wait for profile/hashtag page to load
+                    time.sleep(_rng.uniform(2.5, 4.0))
+                    
+                    # Scroll on the profile/hashtag page
+                    scroll_count = scroll_counts[index - 1]
+                    log(f" Scrolling {scroll_count} times on {target}...")
+                    
+                    like_count = scroll_on_page(page, scroll_count, should_stop, log, like_chance)
+                    with stats_lock:
+                        stats['visited'] += 1
+                        stats['likes'] += like_count
+                        stats['scrolls'] += scroll_count
+                    
+                    log(f" Visited {target} - {scroll_count} scrolls, {like_count} likes")
+                    
+                    # Return to main feed
                     go_back_to_feed(page, log)
-                except:
-                    pass
-        
-        log("Closing browser...")
-        context.close()
-        browser.close()
+                    
+                    # Delay before next profile visit for better simulation
+                    if not pending.empty() and not should_stop():
+                        delay = delays[index - 1]
+                        log(f" Waiting {delay:.1f}s before next profile...")
+                        time.sleep(delay)
+                    
+                except Exception as e:
+                    log(f"❌ Error visiting {target}: {e}")
+                    with stats_lock:
+                        failed_visits.append(target)
+                    # Try to recover by going back to feed
+                    try:
+                        go_back_to_feed(page, log)
+                    except:
+                        pass
+            
+            log("Closing browser...")
+            context.close()
+            browser.close()
+    
+    if concurrency == 1:
+        visit_worker()
+    else:
+        # Each thread owns its own sync_playwright instance and browser;
+        # result() re-raises a worker's failure (e.g. a failed launch) once
+        # all of them have finished, as the single-browser path would
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [executor.submit(visit_worker) for _ in range(concurrency)]
+        for future in futures:
+            future.result()
     
     # Final summary
     log(f"\n{'='*50}")
     log(f"CSV VISIT SUMMARY")
     log(f"{'='*50}")
-    log(f"✅ Successfully visited: {visited_count}/{total_count}")
-    log(f"Total scrolls: {total_scrolls}")
-    log(f"Total likes: {total_likes}")
+    log(f"✅ Successfully visited: {stats['visited']}/{total_count}")
+    log(f"Total scrolls: {stats['scrolls']}")
+    log(f"Total likes: {stats['likes']}")
     if failed_visits:
         log(f"Failed visits ({len(failed_visits)}): {', '.join(failed_visits)}")
     log(f"{'='*50}")
     log("✅ Done!")
+    log.flush()
 
 
-def run_scraper_scroll_session(cookies: list[dict], session_duration, should_stop, log, headless,
+def run_scraper_scroll_session(pool: BrowserPool, session_duration, should_stop, log,
                                target_customer, scraper_chance=0.20, model="llama3:8b",
                                search_targets=None, search_chance=0.30,
                                profile_scroll_count=(3, 8),
-                               max_scraped_accounts=30,
-                               browser_type: BrowserType = DEFAULT_BROWSER):
+                               max_scraped_accounts=30, user_id=None):
     """
     Run a scroll session with 20% chance to trigger the scraper pipeline.
     Scraper only fires while we have < max_scraped_accounts usernames collected.
     Once enough accounts are found, the scraper stops and the session spends
     its time visiting those profiles one-by-one between normal scrolls.
-    """
-    with sync_playwright() as p:
-        browser, context, page = launch_instagram_browser(p, cookies, headless, log, browser_type=browser_type)
 
+    Posts already scraped are remembered per *user_id* and target customer
+    between runs, so two accounts on the same target never skip each
+    other's posts.
+    """
+    page = pool.acquire()
+    try:
         log(f"Starting scraper-enabled scroll session ({session_duration}s)...")
         log(f"🔬 Scraper chance: {int(scraper_chance * 100)}% | Target: {target_customer}")
         log(f"📊 Will collect up to {max_scraped_accounts} accounts before stopping scraper")
@@ -418,30 +565,38 @@ def run_scraper_scroll_session(cookies: list[dict], session_duration, should_sto
             log(f"🔀 Also has {len(search_targets)} search targets ({int(search_chance * 100)}% chance)")
 
         start_time = time.time()
+        deadline = start_time + session_duration
         scroll_count = 0
         like_count = 0
         explore_count = 0
         scraper_runs = 0
         profiles_visited = 0
-        last_explore_time = start_time
-        last_scraper_time = start_time
-        last_visit_time = start_time
         min_time_between_explores = 30
         min_time_between_scraper = 120  # At least 2 min between scraper runs
         min_time_between_visits = 30   # At least 30s between profile visits
+        next_explore_ok_at = start_time + min_time_between_explores
+        next_scraper_ok_at = start_time + min_time_between_scraper
+        next_visit_ok_at = start_time + min_time_between_visits
 
         # Persistent state across scraper runs
         scraped_usernames: list[str] = []
-        visited_posts: set[str] = set()  # Post URLs already scraped (never re-scan)
+        scraped_set: set[str] = set()  # Mirrors scraped_usernames for O(1) membership
+        # Post URLs already scraped (never re-scan), loaded from earlier runs.
+        # A Bloom filter keeps this fixed-size over infinite sessions;
+        # ~0.1% of new posts get skipped. A full filter is replaced by a
+        # new generation so that rate does not creep up.
+        visited_posts_path = _visited_posts_path(target_customer, user_id)
+        visited_posts = _load_visited_posts(visited_posts_path, log)
         visit_index = 0  # Tracks which username to visit next
 
-        while time.time() - start_time < session_duration and not should_stop():
+        while True:
+            now = time.time()
+            if now >= deadline or should_stop():
+                break
             scroll_count += 1
-            elapsed = round(time.time() - start_time, 1)
-            remaining_visits = len(scraped_usernames) - visit_index
-            log(f"📜 Scroll #{scroll_count} | ⏱️ {elapsed}s / {session_duration}s | "
-                f"❤️ {like_count} | 📋 {len(scraped_usernames)} scraped | "
-                f"👤 {profiles_visited} visited | 📝 {remaining_visits} queued")
+            log.debug("📜 Scroll #%d | ⏱️ %.1fs / %ss | ❤️ %d | 📋 %d scraped | 👤 %d visited | 📝 %d queued",
+                      scroll_count, now - start_time, session_duration, like_count,
+                      len(scraped_usernames), profiles_visited, len(scraped_usernames) - visit_index)
 
             # Perform scroll
             did_scroll_up = do_single_scroll(page, log)
@@ -454,14 +609,14 @@ def run_scraper_scroll_session(cookies: list[dict], session_duration, should_sto
                 log(f"❤️ Liked a post! (Total: {like_count})")
 
             # === 20% CHANCE: TRIGGER SCRAPER (only if < 30 accounts collected) ===
-            time_since_last_scraper = time.time() - last_scraper_time
             if (len(scraped_usernames) < max_scraped_accounts and
-                    time_since_last_scraper > min_time_between_scraper and
-                    random.random() < scraper_chance):
+                    now >= next_scraper_ok_at and
+                    deadline - now > SCRAPER_MIN_REMAINING and
+                    _rng.random() < scraper_chance):
 
                 log(f"\n🔬 SCRAPER TRIGGERED! ({len(scraped_usernames)}/{max_scraped_accounts} accounts so far)")
                 scraper_runs += 1
-                last_scraper_time = time.time()
+                next_scraper_ok_at = time.time() + min_time_between_scraper
 
                 # Run the scraper pipeline on the SAME page
                 # visited_posts is shared across runs — already-scraped posts are skipped
@@ -472,21 +627,31 @@ def run_scraper_scroll_session(cookies: list[dict], session_duration, should_sto
                     log=log,
                     visited_posts=visited_posts
                 )
+                if visited_posts.full:
+                    log(f"♻️ Visited-posts filter reached {len(visited_posts)} posts, starting a new one")
+                    visited_posts = _new_visited_posts()
+                    visited_posts.dirty = True  # overwrite the full file
+                # One write per scraper run, and only if it saw new posts
+                if visited_posts.dirty:
+                    try:
+                        visited_posts.save(visited_posts_path)
+                    except OSError as e:
+                        log(f"⚠️ Could not save visited posts: {e}")
 
                 # Navigate back to the main feed after scraping
                 go_back_to_feed(page, log)
 
                 if new_usernames:
                     # Add only new unique usernames, respecting the cap
-                    existing = set(scraped_usernames)
                     added = 0
                     for uname in new_usernames:
                         if len(scraped_usernames) >= max_scraped_accounts:
                             break
-                        if uname not in existing:
-                            scraped_usernames.append(uname)
-                            existing.add(uname)
-                            added += 1
+                        if uname in scraped_set:
+                            continue
+                        scraped_usernames.append(uname)
+                        scraped_set.add(uname)
+                        added += 1
 
                     log(f"✅ Added {added} new usernames (total: {len(scraped_usernames)}/{max_scraped_accounts})")
 
@@ -496,12 +661,13 @@ def run_scraper_scroll_session(cookies: list[dict], session_duration, should_sto
                     log("⚠️ Scraper pipeline returned no usernames, continuing scroll...")
 
                 log("▶️ Resuming scroll session...\n")
+                now = time.time()
 
             # === VISIT NEXT PROFILE from scraped list (one at a time between scrolls) ===
-            time_since_last_visit = time.time() - last_visit_time
             if (visit_index < len(scraped_usernames) and
-                    time_since_last_visit > min_time_between_visits and
-                    random.random() < 0.30):
+                    now >= next_visit_ok_at and
+                    deadline - now > VISIT_MIN_REMAINING and
+                    _rng.random() < 0.30):
 
                 username = scraped_usernames[visit_index]
                 visit_index += 1
@@ -515,11 +681,11 @@ def run_scraper_scroll_session(cookies: list[dict], session_duration, should_sto
                     if not perform_search(page, username, "username", log):
                         log(f"⚠️ Could not find @{username}, skipping...")
                     else:
-                        time.sleep(random.uniform(2.5, 4.0))
+                        time.sleep(_rng.uniform(2.5, 4.0))
                         profiles_visited += 1
 
                         # Scroll on profile page
-                        num_scrolls = random.randint(profile_scroll_count[0], profile_scroll_count[1])
+                        num_scrolls = _rng.randint(profile_scroll_count[0], profile_scroll_count[1])
                         log(f"📜 Scrolling {num_scrolls} times on @{username}'s profile...")
                         visit_likes = scroll_on_page(page, num_scrolls, should_stop, log, like_chance=0.10)
                         like_count += visit_likes
@@ -537,32 +703,32 @@ def run_scraper_scroll_session(cookies: list[dict], session_duration, should_sto
                 except:
                     pass
 
-                last_visit_time = time.time()
+                next_visit_ok_at = time.time() + min_time_between_visits
 
                 # Delay before resuming scrolls
-                delay = random.uniform(5, 15)
+                delay = _rng.uniform(5, 15)
                 log(f"⏳ Waiting {delay:.1f}s before resuming scroll...")
                 time.sleep(delay)
+                now = time.time()
 
             # === REGULAR SEARCH/EXPLORE (existing combined mode logic) ===
-            time_since_last_explore = time.time() - last_explore_time
             if (search_targets and
-                    len(search_targets) > 0 and
-                    time_since_last_explore > min_time_between_explores and
-                    random.random() < search_chance):
+                    now >= next_explore_ok_at and
+                    deadline - now > EXPLORE_MIN_REMAINING and
+                    _rng.random() < search_chance):
 
                 if perform_search_and_explore(page, search_targets, profile_scroll_count, should_stop, log):
                     explore_count += 1
-                    last_explore_time = time.time()
+                    next_explore_ok_at = time.time() + min_time_between_explores
 
         # End-of-session summary
         remaining = len(scraped_usernames) - visit_index
         log(f"\nSession complete: {scroll_count} scrolls, {like_count} likes, "
             f"{explore_count} explores, {scraper_runs} scraper runs, "
             f"{profiles_visited} profiles visited, {remaining} still queued")
-        log("Closing browser...")
-        context.close()
-        browser.close()
+    finally:
+        log.flush()
+        pool.release(page)
 
     return {
         'scrolls': scroll_count,
@@ -587,6 +753,7 @@ def run_combined_scroll_with_scraper(
     search_chance=0.30,
     profile_scroll_count=(3, 8),
     browser_type: BrowserType = DEFAULT_BROWSER,
+    user_id: int | None = None,
 ):
     """
     Combined scroll mode with scraper integration.
@@ -607,21 +774,23 @@ def run_combined_scroll_with_scraper(
     if search_targets:
         log(f"🔀 Combined Mode: Will also randomly explore {len(search_targets)} targets")
 
-    if infinite_mode:
-        def session_runner(session_duration):
-            return run_scraper_scroll_session(
-                cookies, session_duration, should_stop, log, headless,
+    with BrowserPool(cookies, headless, log, browser_type=browser_type) as pool:
+        if infinite_mode:
+            def session_runner(session_duration):
+                return run_scraper_scroll_session(
+                    pool, session_duration, should_stop, log,
+                    target_customer, scraper_chance, model,
+                    search_targets, search_chance, profile_scroll_count,
+                    user_id=user_id,
+                )
+            run_infinite_mode(session_runner, should_stop, log)
+        else:
+            run_scraper_scroll_session(
+                pool, duration, should_stop, log,
                 target_customer, scraper_chance, model,
                 search_targets, search_chance, profile_scroll_count,
-                browser_type=browser_type,
+                user_id=user_id,
             )
-        run_infinite_mode(session_runner, should_stop, log)
-    else:
-        run_scraper_scroll_session(
-            cookies, duration, should_stop, log, headless,
-            target_customer, scraper_chance, model,
-            search_targets, search_chance, profile_scroll_count,
-            browser_type=browser_type,
-        )
 
     log("✅ Done!")
+    log.flush()
@@ -32,10 +32,27 @@ Usage (async):
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import json
 import os
-import platform
+import re
 import shutil
-from typing import Literal
+import sys
+import tempfile
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from functools import lru_cache
+from weakref import WeakKeyDictionary
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext as AsyncBrowserContext
+    from playwright.async_api import Page as AsyncPage
+    from playwright.async_api import Playwright as AsyncPlaywright
+    from playwright.sync_api import BrowserContext, Page, Playwright
+    from playwright.sync_api import BrowserType as Engine
 
 
 # ── Public types & defaults ──────────────────────────────────────────
@@ -49,115 +66,413 @@ SUPPORTED_BROWSERS: list[BrowserType] = [
     "chromium", "chrome", "msedge", "brave", "opera",
     "firefox", "webkit", "safari",
 ]
+_VALID_BROWSERS: frozenset[str] = frozenset(SUPPORTED_BROWSERS)
+_SUPPORTED_STR = ", ".join(SUPPORTED_BROWSERS)
 DEFAULT_BROWSER: BrowserType = "chromium"
 DEFAULT_HEADLESS: bool = False          # headful so the user can watch
 
 # engine:   which Playwright engine to use (chromium / firefox / webkit)
 # channel:  Playwright channel name (only for chromium-based browsers)
-# exe_hint: possible executable names / paths to search for on the system
+# exe_hint: possible executable names / paths to search for, per platform
+#           (%VAR% references are expanded on first use, see _resolve_hints)
 _BROWSER_CONFIG: dict[str, dict] = {
-    "chromium": {"engine": "chromium", "channel": "chrome", "exe_hint": []},
-    "chrome":   {"engine": "chromium", "channel": "chrome", "exe_hint": []},
-    "msedge":   {"engine": "chromium", "channel": "msedge", "exe_hint": []},
+    "chromium": {"engine": "chromium", "channel": "chrome", "exe_hint": {}},
+    "chrome":   {"engine": "chromium", "channel": "chrome", "exe_hint": {}},
+    "msedge":   {"engine": "chromium", "channel": "msedge", "exe_hint": {}},
     "brave": {
         "engine": "chromium",
         "channel": None,
-        "exe_hint": [
-            # Linux
-            "brave-browser", "brave-browser-stable",
-            "/usr/bin/brave-browser",
-            "/usr/bin/brave-browser-stable",
-            "/opt/brave.com/brave/brave-browser",
-            # macOS
-            "/Applications/Brave Browser.app/Contents/MacOS/Brave Browser",
-            # Windows
-            os.path.expandvars(r"%LOCALAPPDATA%\BraveSoftware\Brave-Browser\Application\brave.exe"),
-            os.path.expandvars(r"%PROGRAMFILES%\BraveSoftware\Brave-Browser\Application\brave.exe"),
-        ],
+        "exe_hint": {
+            "linux": [
+                "brave-browser", "brave-browser-stable",
+                "/usr/bin/brave-browser",
+                "/usr/bin/brave-browser-stable",
+                "/opt/brave.com/brave/brave-browser",
+            ],
+            "darwin": [
+                "/Applications/Brave Browser.app/Contents/MacOS/Brave Browser",
+            ],
+            "win32": [
+                r"%LOCALAPPDATA%\BraveSoftware\Brave-Browser\Application\brave.exe",
+                r"%PROGRAMFILES%\BraveSoftware\Brave-Browser\Application\brave.exe",
+            ],
+        },
     },
     "opera": {
         "engine": "chromium",
         "channel": None,
-        "exe_hint": [
-            # Linux
-            "opera", "opera-stable",
-            "/usr/bin/opera",
-            "/usr/bin/opera-stable",
-            "/snap/bin/opera",
-            # macOS
-            "/Applications/Opera.app/Contents/MacOS/Opera",
-            "/Applications/Opera GX.app/Contents/MacOS/Opera",
-            # Windows
-            os.path.expandvars(r"%LOCALAPPDATA%\Programs\Opera\opera.exe"),
-            os.path.expandvars(r"%LOCALAPPDATA%\Programs\Opera GX\opera.exe"),
-            os.path.expandvars(r"%APPDATA%\Opera Software\Opera Stable\opera.exe"),
-            os.path.expandvars(r"%APPDATA%\Opera Software\Opera GX Stable\opera.exe"),
-        ],
+        "exe_hint": {
+            "linux": [
+                "opera", "opera-stable",
+                "/usr/bin/opera",
+                "/usr/bin/opera-stable",
+                "/snap/bin/opera",
+            ],
+            "darwin": [
+                "/Applications/Opera.app/Contents/MacOS/Opera",
+                "/Applications/Opera GX.app/Contents/MacOS/Opera",
+            ],
+            "win32": [
+                r"%LOCALAPPDATA%\Programs\Opera\opera.exe",
+                r"%LOCALAPPDATA%\Programs\Opera GX\opera.exe",
+                r"%APPDATA%\Opera Software\Opera Stable\opera.exe",
+                r"%APPDATA%\Opera Software\Opera GX Stable\opera.exe",
+            ],
+        },
     },
-    "firefox": {"engine": "firefox", "channel": None, "exe_hint": []},
-    "webkit":  {"engine": "webkit",  "channel": None, "exe_hint": []},
-    "safari":  {"engine": "webkit",  "channel": None, "exe_hint": []},  # alias
+    "firefox": {"engine": "firefox", "channel": None, "exe_hint": {}},
+    "webkit":  {"engine": "webkit",  "channel": None, "exe_hint": {}},
+    "safari":  {"engine": "webkit",  "channel": None, "exe_hint": {}},  # alias
 }
 
+# exe_hint key for this OS (other Unixes use the Linux locations)
+_MY_PLAT = (
+    "win32" if sys.platform.startswith("win")
+    else "darwin" if sys.platform == "darwin"
+    else "linux"
+)
+
+
+@lru_cache(maxsize=None)
+def _resolve_hints(browser_type: BrowserType) -> tuple[str, ...]:
+    """This OS's exe hints for *browser_type*, expanded once per process.
+
+    Hints whose %VAR% is unset on this machine are dropped.
+    """
+    expanded = (os.path.expandvars(h) for h in _BROWSER_CONFIG[browser_type]["exe_hint"].get(_MY_PLAT, ()))
+    return tuple(h for h in expanded if "%" not in h and "$" not in h)
+
+
+# browser_type → (engine name, channel, has exe hints), resolved once at import
+_RESOLVED: dict[str, tuple[str, str | None, bool]] = {
+    name: (cfg["engine"], cfg["channel"], bool(cfg["exe_hint"]))
+    for name, cfg in _BROWSER_CONFIG.items()
+}
+
+# Executable search path, read once at import instead of per shutil.which call
+_PATH_DIRS: tuple[str, ...] = tuple(d for d in os.environ.get("PATH", "").split(os.pathsep) if d)
+_PATHEXT: tuple[str, ...] = (
+    ("",) + tuple(e.lower() for e in os.environ.get("PATHEXT", ".EXE;.BAT").split(";") if e)
+    if os.name == "nt" else ("",)
+)
+
+# Chromium switches that skip per-launch background work (first-run UI,
+# sync, component updates, safe-browsing and default-app fetches).
+_CHROMIUM_FAST_ARGS: tuple[str, ...] = (
+    "--no-default-browser-check",
+    "--no-first-run",
+    "--disable-background-networking",
+    "--disable-client-side-phishing-detection",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-component-update",
+    "--no-pings",
+)
+
+# (browser_type, channel) → time its channel was found not installed on
+# this machine. Remembered across runs for _CHANNEL_RECHECK_S, so the
+# failed spawn is paid once a week rather than on every launch; a
+# browser installed later is picked up after that.
+_CHANNEL_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "rpa_backend", "channels.json")
+_CHANNEL_RECHECK_S = 7 * 24 * 3600
+
+# Playwright's errors for a channel / executable that is not installed
+_MISSING_BROWSER_RE = re.compile(r"is not found at|Executable doesn't exist")
+
+
+def _load_unavailable_channels() -> dict[tuple[str, str], float]:
+    cutoff = time.time() - _CHANNEL_RECHECK_S
+    try:
+        with open(_CHANNEL_CACHE_FILE, encoding="utf-8") as f:
+            entries = json.load(f)
+        return {
+            (browser_type, channel): marked
+            for browser_type, channel, marked in (e for e in entries if len(e) == 3)
+            if marked > cutoff
+        }
+    except (OSError, ValueError, TypeError):
+        return {}
+
+
+_CHANNEL_UNAVAILABLE: dict[tuple[str, str], float] = _load_unavailable_channels()
+_channels_dirty = False
+
+
+def _mark_channel_unavailable(browser_type: BrowserType, channel: str, error: Exception) -> None:
+    """Remember *channel* as missing, but only when *error* says it is not
+    installed; timeouts, sandbox or memory failures are not remembered."""
+    global _channels_dirty
+    if not _MISSING_BROWSER_RE.search(str(error)):
+        return
+    _CHANNEL_UNAVAILABLE[(browser_type, channel)] = time.time()
+    _channels_dirty = True
+
+
+@atexit.register
+def _save_unavailable_channels() -> None:
+    if not _channels_dirty:
+        return
+    try:
+        os.makedirs(os.path.dirname(_CHANNEL_CACHE_FILE), exist_ok=True)
+        with open(_CHANNEL_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(sorted([*pair, marked] for pair, marked in _CHANNEL_UNAVAILABLE.items()), f)
+    except OSError:
+        pass
+
 
 # ── Internal helpers ─────────────────────────────────────────────────
 
-def _find_executable(hints: list[str]) -> str | None:
-    """Try to locate a browser executable from a list of hints."""
+# Executables already found, per hints tuple. Misses are not cached, so a
+# browser installed while the process runs is picked up on the next launch.
+_FOUND_EXECUTABLES: dict[tuple[str, ...], str] = {}
+
+
+def _search_executable(hints: tuple[str, ...]) -> str | None:
     for hint in hints:
         # Absolute path?
-        if os.path.isfile(hint):
-            return hint
+        if os.path.isabs(hint):
+            if os.path.isfile(hint):
+                return hint
+            continue
         # On PATH?
-        found = shutil.which(hint)
-        if found:
-            return found
+        for directory in _PATH_DIRS:
+            for ext in _PATHEXT:
+                candidate = os.path.join(directory, hint + ext)
+                if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+                    return candidate
     return None
 
 
-def _engine(playwright, browser_type: BrowserType):
+def _find_executable(hints: tuple[str, ...]) -> str | None:
+    """Try to locate a browser executable from a tuple of hints.
+
+    Hints are tried in order: absolute paths with a single stat, bare
+    names against the cached PATH. A found path is cached per hints
+    tuple, so repeat launches skip the filesystem.
+    """
+    exe = _FOUND_EXECUTABLES.get(hints)
+    if exe is None:
+        exe = _search_executable(hints)
+        if exe is not None:
+            _FOUND_EXECUTABLES[hints] = exe
+    return exe
+
+
+def _engine(playwright: Playwright | AsyncPlaywright, browser_type: BrowserType) -> Engine:
     """Return the Playwright engine object for a given browser_type."""
-    config = _BROWSER_CONFIG.get(browser_type)
-    if config is None:
-        raise ValueError(
-            f"Unsupported browser_type={browser_type!r}. "
-            f"Choose from: {', '.join(SUPPORTED_BROWSERS)}"
-        )
-    engine_name = config["engine"]
-    engines = {
-        "chromium": playwright.chromium,
-        "firefox": playwright.firefox,
-        "webkit":  playwright.webkit,
-    }
-    return engines[engine_name]
+    if browser_type not in _VALID_BROWSERS:
+        raise ValueError(f"Unsupported browser_type={browser_type!r}. Choose from: {_SUPPORTED_STR}")
+    return getattr(playwright, _RESOLVED[browser_type][0])
 
 
 def _build_opts(
     browser_type: BrowserType,
     headless: bool,
-    extra: dict,
-) -> dict:
+    extra: dict[str, Any],
+    fast_start: bool = True,
+) -> dict[str, Any]:
     """Build the kwargs dict for launch / launch_persistent_context."""
-    opts: dict = {"headless": headless, **extra}
-    config = _BROWSER_CONFIG.get(browser_type, {})
+    opts: dict[str, Any] = {"headless": headless, **extra}
+    engine_name, channel, has_exe_hint = _RESOLVED[browser_type]
 
-    # For Brave / Opera: find the executable and set executablePath
-    if config.get("exe_hint"):
-        exe = _find_executable(config["exe_hint"])
+    # Caller-supplied args win over the fast-start defaults
+    if fast_start and engine_name == "chromium" and "args" not in extra:
+        opts["args"] = list(_CHROMIUM_FAST_ARGS)
+
+    # For Brave / Opera: find the executable (cached per process) and set executablePath
+    if has_exe_hint:
+        exe_hint = _resolve_hints(browser_type)
+        exe = _find_executable(exe_hint)
         if exe:
             opts.setdefault("executable_path", exe)
         else:
             raise FileNotFoundError(
                 f"Could not find {browser_type} on this system. "
-                f"Make sure it is installed. Searched: {config['exe_hint'][:3]}..."
+                f"Make sure it is installed. Searched: {list(exe_hint[:3])}..."
             )
-    # For chrome / msedge: use Playwright's built-in channel
-    elif config.get("channel"):
-        opts.setdefault("channel", config["channel"])
+    # For chrome / msedge: use Playwright's built-in channel, unless it
+    # already failed to launch on this machine
+    elif channel and (browser_type, channel) not in _CHANNEL_UNAVAILABLE:
+        opts.setdefault("channel", channel)
 
     return opts
 
 
+def _launch_with_fallback(browser_type: BrowserType, launch, opts: dict[str, Any], *args):
+    """Call ``launch(*args, **opts)``; if it fails and a channel was requested,
+    retry without the channel, remembering it if it is not installed."""
+    try:
+        return launch(*args, **opts)
+    except Exception as e:
+        if "channel" not in opts:
+            raise
+        channel = opts.pop("channel")
+        launched = launch(*args, **opts)
+        _mark_channel_unavailable(browser_type, channel, e)
+        return launched
+
+
+async def _launch_with_fallback_async(browser_type: BrowserType, launch, opts: dict[str, Any], *args):
+    """Async version of :func:`_launch_with_fallback`."""
+    try:
+        return await launch(*args, **opts)
+    except Exception as e:
+        if "channel" not in opts:
+            raise
+        channel = opts.pop("channel")
+        launched = await launch(*args, **opts)
+        _mark_channel_unavailable(browser_type, channel, e)
+        return launched
+
+
+# ── Event loop ───────────────────────────────────────────────────────
+
+@lru_cache(maxsize=1)
+def _uvloop_factory():
+    """``uvloop.new_event_loop`` if uvloop is usable here, else None.
+
+    uvloop ships with ``uvicorn[standard]``; it has no Windows build, and
+    loop factories need ``asyncio.Runner`` (Python 3.11+).
+    """
+    if sys.platform == "win32" or not hasattr(asyncio, "Runner"):
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+def run_async(main):
+    """Run coroutine *main* to completion on a new uvloop event loop when
+    available, else on ``asyncio.run``'s default loop.
+
+    Only this one loop is uvloop: the process-wide event-loop policy is
+    left alone, so other threads' loops (e.g. sync Playwright) keep the
+    default.
+    """
+    loop_factory = _uvloop_factory()
+    if loop_factory is None:
+        return asyncio.run(main)
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(main)
+
+
+# ── Warm profile templates ───────────────────────────────────────────
+
+# One first-run-initialised profile per browser_type; fresh persistent
+# profiles are seeded from it so Chromium / Firefox skip first-run work
+_TEMPLATE_ROOT = os.path.join(os.path.expanduser("~"), ".cache", "rpa_backend", "profile_templates")
+# Lock / socket files that belong to a running instance, never copied
+_TEMPLATE_IGNORE = ("Singleton*", "lockfile", "parent.lock", ".parentlock", "*.lock")
+# Caller launch options that would only slow a template build down
+_TEMPLATE_DROP_OPTS = ("slow_mo", "devtools")
+# One template build at a time in this process; across processes each
+# build goes to its own temp dir and is published with an atomic rename
+_TEMPLATE_LOCK = threading.Lock()
+
+
+def _needs_seed(user_data_dir: str) -> bool:
+    return not os.path.isdir(user_data_dir) or not os.listdir(user_data_dir)
+
+
+def _copy_template(template_dir: str, user_data_dir: str) -> None:
+    """Copy the template into *user_data_dir*.
+
+    Real copies, not hardlinks: browsers rewrite their SQLite / prefs
+    files in place, which would corrupt a template shared by link.
+    """
+    shutil.copytree(
+        template_dir, user_data_dir, symlinks=True, dirs_exist_ok=True,
+        ignore=shutil.ignore_patterns(*_TEMPLATE_IGNORE),
+    )
+
+
+def _template_opts(opts: dict[str, Any]) -> dict[str, Any]:
+    # Template builds run headless at full speed, whatever the caller asked for
+    return {**{k: v for k, v in opts.items() if k not in _TEMPLATE_DROP_OPTS}, "headless": True}
+
+
+def _new_build_dir(browser_type: BrowserType) -> str:
+    os.makedirs(_TEMPLATE_ROOT, exist_ok=True)
+    return tempfile.mkdtemp(prefix=f".{browser_type}-build-", dir=_TEMPLATE_ROOT)
+
+
+def _publish_template(build_dir: str, template_dir: str) -> None:
+    """Move a finished build into place in one rename. If another process
+    published a template first, keep that one and drop this build."""
+    try:
+        if os.path.isdir(template_dir) and not os.listdir(template_dir):
+            os.rmdir(template_dir)
+        os.replace(build_dir, template_dir)
+    except OSError:
+        shutil.rmtree(build_dir, ignore_errors=True)
+
+
+def _template_failed(browser_type: BrowserType, error: Exception) -> None:
+    print(f"⚠️ Could not seed the {browser_type} profile from a template, "
+          f"starting from a bare profile: {error}")
+
+
+async def _acquire_template_lock_async() -> None:
+    """Acquire ``_TEMPLATE_LOCK`` on a worker thread, so the event loop
+    keeps running while another build holds it. If the wait is cancelled,
+    the lock is released as soon as the worker gets it."""
+    acquire = asyncio.ensure_future(asyncio.to_thread(_TEMPLATE_LOCK.acquire))
+    try:
+        await asyncio.shield(acquire)
+    except asyncio.CancelledError:
+        acquire.add_done_callback(
+            lambda f: f.cancelled() or f.exception() is not None or _TEMPLATE_LOCK.release()
+        )
+        raise
+
+
+def _seed_profile(browser_type: BrowserType, launch, opts: dict[str, Any], user_data_dir: str) -> None:
+    """Seed an empty *user_data_dir* from the template, building it once (sync)."""
+    template_dir = os.path.join(_TEMPLATE_ROOT, browser_type)
+    try:
+        if _needs_seed(template_dir):
+            with _TEMPLATE_LOCK:
+                if _needs_seed(template_dir):
+                    build_dir = _new_build_dir(browser_type)
+                    try:
+                        _launch_with_fallback(browser_type, launch, _template_opts(opts), build_dir).close()
+                    except Exception:
+                        shutil.rmtree(build_dir, ignore_errors=True)
+                        raise
+                    _publish_template(build_dir, template_dir)
+        _copy_template(template_dir, user_data_dir)
+    except Exception as e:
+        # A template is an optimisation only; launch into the bare profile
+        _template_failed(browser_type, e)
+
+
+async def _seed_profile_async(browser_type: BrowserType, launch, opts: dict[str, Any], user_data_dir: str) -> None:
+    """Async version of :func:`_seed_profile`."""
+    template_dir = os.path.join(_TEMPLATE_ROOT, browser_type)
+    try:
+        if _needs_seed(template_dir):
+            await _acquire_template_lock_async()
+            try:
+                if _needs_seed(template_dir):
+                    build_dir = _new_build_dir(browser_type)
+                    try:
+                        context = await _launch_with_fallback_async(
+                            browser_type, launch, _template_opts(opts), build_dir,
+                        )
+                        await context.close()
+                    except Exception:
+                        shutil.rmtree(build_dir, ignore_errors=True)
+                        raise
+                    _publish_template(build_dir, template_dir)
+            finally:
+                _TEMPLATE_LOCK.release()
+        await asyncio.to_thread(_copy_template, template_dir, user_data_dir)
+    except Exception as e:
+        _template_failed(browser_type, e)
+
+
 # ── Sync API ─────────────────────────────────────────────────────────
 
 def launch_persistent(
@@ -165,48 +480,63 @@ def launch_persistent(
     user_data_dir: str,
     browser_type: BrowserType = DEFAULT_BROWSER,
     headless: bool = DEFAULT_HEADLESS,
+    fast_start: bool = True,
+    use_template: bool = True,
     **extra,
 ):
     """Launch a **persistent** browser context (sync).
 
     Persistent contexts keep cookies / local-storage between runs.
-    Works with all three engines.
+    Works with all three engines. An empty *user_data_dir* is first
+    seeded from a warm profile template (``use_template=False`` to skip).
     """
     engine = _engine(playwright, browser_type)
-    opts = _build_opts(browser_type, headless, extra)
-
-    try:
-        return engine.launch_persistent_context(user_data_dir, **opts)
-    except Exception:
-        # Chrome channel not installed → fall back to plain Chromium
-        if "channel" in opts:
-            opts.pop("channel")
-            return engine.launch_persistent_context(user_data_dir, **opts)
-        raise
+    opts = _build_opts(browser_type, headless, extra, fast_start)
+    if use_template and _needs_seed(user_data_dir):
+        _seed_profile(browser_type, engine.launch_persistent_context, opts, user_data_dir)
+    return _launch_with_fallback(browser_type, engine.launch_persistent_context, opts, user_data_dir)
 
 
 def launch_browser(
     playwright,
     browser_type: BrowserType = DEFAULT_BROWSER,
     headless: bool = DEFAULT_HEADLESS,
+    fast_start: bool = True,
     **extra,
 ):
     """Launch a non-persistent browser (sync)."""
     engine = _engine(playwright, browser_type)
-    opts = _build_opts(browser_type, headless, extra)
+    opts = _build_opts(browser_type, headless, extra, fast_start)
+    return _launch_with_fallback(browser_type, engine.launch, opts)
 
-    try:
-        return engine.launch(**opts)
-    except Exception:
-        if "channel" in opts:
-            opts.pop("channel")
-            return engine.launch(**opts)
-        raise
+
+# context → its first page, so repeat get_page calls skip building the
+# context.pages list. The page refers back to its context, so entries are
+# also dropped when the context closes.
+_FIRST_PAGE_CACHE: "WeakKeyDictionary[object, object]" = WeakKeyDictionary()
+
+
+def _cached_first_page(context):
+    page = _FIRST_PAGE_CACHE.get(context)
+    if page is not None and not page.is_closed():
+        return page
+    return None
 
 
-def get_page(context):
+def _remember_first_page(context, page):
+    if context not in _FIRST_PAGE_CACHE:
+        context.on("close", lambda closed: _FIRST_PAGE_CACHE.pop(closed, None))
+    _FIRST_PAGE_CACHE[context] = page
+    return page
+
+
+def get_page(context: BrowserContext) -> Page:
     """Return the first page of a context, or create one (sync)."""
-    return context.pages[0] if context.pages else context.new_page()
+    page = _cached_first_page(context)
+    if page is None:
+        pages = context.pages
+        page = _remember_first_page(context, pages[0] if pages else context.new_page())
+    return page
 
 
 # ── Async API ────────────────────────────────────────────────────────
@@ -216,48 +546,209 @@ async def launch_persistent_async(
     user_data_dir: str,
     browser_type: BrowserType = DEFAULT_BROWSER,
     headless: bool = DEFAULT_HEADLESS,
+    fast_start: bool = True,
+    use_template: bool = True,
     **extra,
 ):
     """Launch a **persistent** browser context (async)."""
     engine = _engine(playwright, browser_type)
-    opts = _build_opts(browser_type, headless, extra)
-
-    try:
-        return await engine.launch_persistent_context(user_data_dir, **opts)
-    except Exception:
-        if "channel" in opts:
-            opts.pop("channel")
-            return await engine.launch_persistent_context(user_data_dir, **opts)
-        raise
+    opts = _build_opts(browser_type, headless, extra, fast_start)
+    if use_template and _needs_seed(user_data_dir):
+        await _seed_profile_async(browser_type, engine.launch_persistent_context, opts, user_data_dir)
+    return await _launch_with_fallback_async(browser_type, engine.launch_persistent_context, opts, user_data_dir)
 
 
 async def launch_browser_async(
     playwright,
     browser_type: BrowserType = DEFAULT_BROWSER,
     headless: bool = DEFAULT_HEADLESS,
+    fast_start: bool = True,
     **extra,
 ):
     """Launch a non-persistent browser (async)."""
     engine = _engine(playwright, browser_type)
-    opts = _build_opts(browser_type, headless, extra)
+    opts = _build_opts(browser_type, headless, extra, fast_start)
+    return await _launch_with_fallback_async(browser_type, engine.launch, opts)
+
+
+async def get_page_async(context: AsyncBrowserContext) -> AsyncPage:
+    """Return the first page of a context, or create one (async)."""
+    page = _cached_first_page(context)
+    if page is None:
+        pages = context.pages
+        page = _remember_first_page(context, pages[0] if pages else await context.new_page())
+    return page
+
+
+# ── Shared browser ───────────────────────────────────────────────────
+
+def _shared_target(browser_type: BrowserType, ws_endpoint: str | None) -> tuple[str, str] | None:
+    """("ws", endpoint) for a Playwright server, ("cdp", endpoint) for a
+    Chromium started with --remote-debugging-port, or None."""
+    endpoint = ws_endpoint or os.environ.get("PLAYWRIGHT_WS_ENDPOINT")
+    if endpoint:
+        return "ws", endpoint
+    endpoint = os.environ.get("PLAYWRIGHT_CDP_ENDPOINT")
+    if endpoint and browser_type in _VALID_BROWSERS and _RESOLVED[browser_type][0] == "chromium":
+        return "cdp", endpoint
+    return None
+
 
+def connect_shared(playwright, browser_type: BrowserType = DEFAULT_BROWSER, ws_endpoint: str | None = None):
+    """
+    Connect to a long-lived browser running outside this process (sync):
+
+    - *ws_endpoint* or ``$PLAYWRIGHT_WS_ENDPOINT``: a Playwright server
+      (``playwright run-server``), any browser type;
+    - otherwise ``$PLAYWRIGHT_CDP_ENDPOINT`` (e.g. ``http://127.0.0.1:9222``):
+      a Chromium-family browser started once with
+      ``--remote-debugging-port``, used for Chromium-based browser types.
+
+    Returns None when neither is configured or reachable. Each call opens
+    its own connection, owned by the caller's playwright instance: close
+    it together with the session. Closing only disconnects (and drops the
+    contexts opened on it); the browser process keeps running.
+    """
+    target = _shared_target(browser_type, ws_endpoint)
+    if target is None:
+        return None
+    kind, endpoint = target
     try:
-        return await engine.launch(**opts)
+        if kind == "cdp":
+            return playwright.chromium.connect_over_cdp(endpoint)
+        return _engine(playwright, browser_type).connect(endpoint)
     except Exception:
-        if "channel" in opts:
-            opts.pop("channel")
-            return await engine.launch(**opts)
-        raise
+        return None
 
 
-async def get_page_async(context):
-    """Return the first page of a context, or create one (async)."""
-    return context.pages[0] if context.pages else await context.new_page()
+async def connect_shared_async(playwright, browser_type: BrowserType = DEFAULT_BROWSER, ws_endpoint: str | None = None):
+    """Async version of :func:`connect_shared`."""
+    target = _shared_target(browser_type, ws_endpoint)
+    if target is None:
+        return None
+    kind, endpoint = target
+    try:
+        if kind == "cdp":
+            return await playwright.chromium.connect_over_cdp(endpoint)
+        return await _engine(playwright, browser_type).connect(endpoint)
+    except Exception:
+        return None
+
+
+async def connect_or_launch_async(
+    playwright,
+    browser_type: BrowserType = DEFAULT_BROWSER,
+    headless: bool = DEFAULT_HEADLESS,
+    ws_endpoint: str | None = None,
+    **extra,
+):
+    """
+    Return a connection to a shared running browser, or a new browser (async).
+
+    With a shared browser configured (see :func:`connect_shared`: a
+    Playwright server or a CDP endpoint), connects to it, so no browser
+    process is spawned here at all. Otherwise, or if it cannot be
+    reached, launches one.
+
+    Close the result when done: a shared connection is only disconnected.
+    """
+    browser = await connect_shared_async(playwright, browser_type, ws_endpoint)
+    if browser is not None:
+        return browser
+    return await launch_browser_async(playwright, browser_type=browser_type, headless=headless, **extra)
 
 
 # ── Cookie-based launch (no persistent profile needed) ───────────────
 
 _DEFAULT_VIEWPORT = {"width": 1280, "height": 720}
+_NAVIGATION_TIMEOUT_MS = 15_000
+
+
+_SAME_SITE = {
+    "strict": "Strict", "lax": "Lax", "none": "None", "no_restriction": "None",
+}
+
+# Image, video and font URLs aborted by block_media=True. A regex (not a
+# "**/*" route) so only these requests are intercepted; the extension is
+# matched on the path, with any CDN query string after it.
+_MEDIA_URL_RE = re.compile(r"^[^?#]*\.(?:png|jpe?g|webp|gif|mp4|woff2?)(?:[?#]|$)", re.IGNORECASE)
+
+
+def _clean_cookies(cookies: list[dict]) -> list[dict]:
+    """Drop or fix cookies Playwright would reject, so one bad entry cannot
+    fail the whole ``add_cookies`` call.
+
+    A cookie needs a name, a string value and either a url or a domain (a
+    missing path then defaults to "/"). Browser-export sameSite spellings
+    such as "no_restriction" or "unspecified" are mapped or removed.
+    """
+    cleaned = []
+    for cookie in cookies:
+        if not cookie.get("name") or not isinstance(cookie.get("value"), str):
+            continue
+        if not cookie.get("url") and not cookie.get("domain"):
+            continue
+        if cookie.get("domain") and not cookie.get("url") and not cookie.get("path"):
+            cookie = {**cookie, "path": "/"}
+        same_site = cookie.get("sameSite")
+        if same_site is not None and same_site not in ("Strict", "Lax", "None"):
+            cookie = dict(cookie)
+            mapped = _SAME_SITE.get(str(same_site).lower())
+            if mapped:
+                cookie["sameSite"] = mapped
+            else:
+                del cookie["sameSite"]
+        cleaned.append(cookie)
+    return cleaned
+
+
+def _block_media(context) -> None:
+    """Abort image/video/font requests in *context* (sync)."""
+    context.route(_MEDIA_URL_RE, lambda route: route.abort())
+
+
+async def _block_media_async(context) -> None:
+    """Abort image/video/font requests in *context* (async)."""
+    await context.route(_MEDIA_URL_RE, lambda route: route.abort())
+
+
+def _should_navigate(goto_url: str | None) -> bool:
+    # A new page already sits on about:blank; None means "no navigation"
+    return goto_url is not None and goto_url != "about:blank"
+
+
+def _cookie_state(cookies: list[dict]) -> dict:
+    # Cookies given as storage_state are applied while the context is created
+    return {"cookies": _clean_cookies(cookies), "origins": []}
+
+
+def _open_cookie_page(browser, cookies: list[dict], goto_url: str | None, wait_until: str,
+                      block_media: bool = False):
+    """New context with *cookies* and one page at *goto_url* (sync)."""
+    context = browser.new_context(viewport=_DEFAULT_VIEWPORT, storage_state=_cookie_state(cookies))
+    if block_media:
+        _block_media(context)
+    page = context.new_page()
+    if _should_navigate(goto_url):
+        page.goto(goto_url, wait_until=wait_until, timeout=_NAVIGATION_TIMEOUT_MS)
+    return context, page
+
+
+async def _open_cookie_page_async(browser, cookies: list[dict], goto_url: str | None, wait_until: str,
+                                  block_media: bool = False):
+    """New context with *cookies* and one page at *goto_url* (async).
+
+    The cookies go in as the context's ``storage_state``, so they are set
+    by the ``new_context`` call itself rather than a separate
+    ``add_cookies`` round-trip.
+    """
+    context = await browser.new_context(viewport=_DEFAULT_VIEWPORT, storage_state=_cookie_state(cookies))
+    if block_media:
+        await _block_media_async(context)
+    page = await context.new_page()
+    if _should_navigate(goto_url):
+        await page.goto(goto_url, wait_until=wait_until, timeout=_NAVIGATION_TIMEOUT_MS)
+    return context, page
 
 
 def launch_with_cookies(
@@ -265,20 +756,42 @@ def launch_with_cookies(
     cookies: list[dict],
     browser_type: BrowserType = DEFAULT_BROWSER,
     headless: bool = DEFAULT_HEADLESS,
-    goto_url: str = "https://www.instagram.com/",
+    goto_url: str | None = "https://www.instagram.com/",
+    wait_until: str = "domcontentloaded",
+    shared: bool = False,
+    block_media: bool = False,
     **extra,
 ):
     """
     Launch a **non-persistent** browser, inject *cookies*, navigate to
     Instagram and return ``(browser, context, page)`` (sync).
 
-    The caller MUST close ``context`` and ``browser`` when done.
+    Pass ``goto_url=None`` (or ``"about:blank"``) to get the cookie-loaded
+    page without any navigation when the next step opens another URL.
+
+    Navigation returns at ``wait_until="domcontentloaded"`` (15s timeout),
+    which is enough to drive the page; pass ``wait_until="load"`` to also
+    wait for every image and third-party script.
+
+    The caller MUST close ``context`` and ``browser`` when done; new code
+    should use :func:`session_with_cookies`, which does it automatically.
+
+    With ``shared=True`` the context is opened on the long-lived browser
+    server from :func:`connect_shared` when one is configured; the
+    returned browser is then that connection, and closing it only
+    disconnects. Without a reachable server a browser is launched as usual.
+
+    With ``block_media=True`` image, video and font requests are aborted,
+    for pages that are only read (DOM/JSON), never looked at.
     """
+    if shared:
+        browser = connect_shared(playwright, browser_type)
+        if browser is not None:
+            context, page = _open_cookie_page(browser, cookies, goto_url, wait_until, block_media)
+            return browser, context, page
+
     browser = launch_browser(playwright, browser_type=browser_type, headless=headless, **extra)
-    context = browser.new_context(viewport=_DEFAULT_VIEWPORT)
-    context.add_cookies(cookies)
-    page = context.new_page()
-    page.goto(goto_url)
+    context, page = _open_cookie_page(browser, cookies, goto_url, wait_until, block_media)
     return browser, context, page
 
 
@@ -287,16 +800,75 @@ async def launch_with_cookies_async(
     cookies: list[dict],
     browser_type: BrowserType = DEFAULT_BROWSER,
     headless: bool = DEFAULT_HEADLESS,
-    goto_url: str = "https://www.instagram.com/",
+    goto_url: str | None = "https://www.instagram.com/",
+    wait_until: str = "domcontentloaded",
+    shared: bool = False,
+    block_media: bool = False,
     **extra,
 ):
     """
     Async version of :func:`launch_with_cookies`.
     Returns ``(browser, context, page)``.
     """
+    if shared:
+        browser = await connect_shared_async(playwright, browser_type)
+        if browser is not None:
+            context, page = await _open_cookie_page_async(browser, cookies, goto_url, wait_until, block_media)
+            return browser, context, page
+
     browser = await launch_browser_async(playwright, browser_type=browser_type, headless=headless, **extra)
-    context = await browser.new_context(viewport=_DEFAULT_VIEWPORT)
-    await context.add_cookies(cookies)
-    page = await context.new_page()
-    await page.goto(goto_url)
+    context, page = await _open_cookie_page_async(browser, cookies, goto_url, wait_until, block_media)
     return browser, context, page
+
+
+@contextmanager
+def session_with_cookies(
+    playwright,
+    cookies: list[dict],
+    browser_type: BrowserType = DEFAULT_BROWSER,
+    headless: bool = DEFAULT_HEADLESS,
+    goto_url: str | None = "https://www.instagram.com/",
+    **extra,
+):
+    """
+    Context-managed :func:`launch_with_cookies` (sync): yields the page and
+    always closes the context and browser on exit, even on error.
+    Prefer this in new code over managing ``(browser, context, page)``.
+
+        with session_with_cookies(p, cookies) as page:
+            ...
+    """
+    browser, context, page = launch_with_cookies(
+        playwright, cookies, browser_type=browser_type, headless=headless,
+        goto_url=goto_url, **extra,
+    )
+    try:
+        yield page
+    finally:
+        try:
+            context.close()
+        finally:
+            browser.close()
+
+
+@asynccontextmanager
+async def session_with_cookies_async(
+    playwright,
+    cookies: list[dict],
+    browser_type: BrowserType = DEFAULT_BROWSER,
+    headless: bool = DEFAULT_HEADLESS,
+    goto_url: str | None = "https://www.instagram.com/",
+    **extra,
+):
+    """Async version of :func:`session_with_cookies`."""
+    browser, context, page = await launch_with_cookies_async(
+        playwright, cookies, browser_type=browser_type, headless=headless,
+        goto_url=goto_url, **extra,
+    )
+    try:
+        yield page
+    finally:
+        try:
+            await context.close()
+        finally:
+            await browser.close()
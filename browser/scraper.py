@@ -2,28 +2,41 @@ import asyncio
 import random
 import os
 import re
-from collections import Counter
 from playwright.async_api import async_playwright
 from config.targets import get_target_config
+from browser.scrolling import create_log_function
 from browser.launcher import (
-    launch_with_cookies_async,
+    session_with_cookies_async,
     BrowserType,
     DEFAULT_BROWSER,
     DEFAULT_HEADLESS,
 )
 USERNAME_PATTERN = re.compile(r'^/([a-zA-Z0-9_.]{1,30})/$')
+META_AT_RE = re.compile(r'@([a-zA-Z0-9_.]+)')
+USERNAME_CHARS_RE = re.compile(r'^[a-zA-Z0-9_.]+$')
 
 MAX_ACCOUNTS_PER_SESSION = 30
 MAX_HASHTAGS_PER_SESSION = 3
 MAX_POSTS_PER_HASHTAG = 5
 MAX_COMMENTERS_PER_POST = 15
 MAX_COMMENT_SCROLLS = 3
+# Posts of one hashtag scraped at once; kept low to stay under rate limits
+POST_CONCURRENCY = 3
+# A post's <article> usually renders right after domcontentloaded; the
+# read_content delay that follows covers the slow cases
+ARTICLE_WAIT_MS = 2000
 
-EXCLUDED_PATHS = {
+EXCLUDED_PATHS = frozenset({
     '/', '/explore/', '/p/', '/reel/', '/reels/', '/stories/',
     '/accounts/', '/direct/', '/tags/', '/locations/'
-}
-SYSTEM_USERNAMES = {'explore', 'p', 'reel', 'reels', 'stories', 'accounts', 'direct'}
+})
+# Single-segment profile links (href="/name/") in serialized page HTML
+HREF_USER_RE = re.compile(r'href="/([a-zA-Z0-9_.]{1,30})/"')
+SYSTEM_USERNAMES = frozenset({'explore', 'p', 'reel', 'reels', 'stories', 'accounts', 'direct'})
+# USERNAME_PATTERN minus the system names, so a match is already a valid candidate
+VALID_USERNAME_RE = re.compile(
+    r'^/(?!(?:%s)/)([a-zA-Z0-9_.]{1,30})/$' % "|".join(re.escape(u) for u in sorted(SYSTEM_USERNAMES))
+)
 
 # Shared delay map used by both async and sync helpers
 DELAY_MAP = {
@@ -35,6 +48,10 @@ DELAY_MAP = {
     "comment_scroll": (2, 4),
     "default": (2, 4)
 }
+# Delays are pre-drawn per action in batches and refilled when used up,
+# so they never repeat in a cycle
+DELAY_POOL_SIZE = 64
+_delay_pools: dict[str, list[float]] = {}
 
 # Selectors shared between async and sync scrapers
 VIEW_MORE_SELECTORS = [
@@ -42,6 +59,19 @@ VIEW_MORE_SELECTORS = [
     'span:has-text("View all")',
     'button[type="button"]:has-text("more")',
 ]
+# Reads every matched element's href in one browser round-trip
+HREFS_JS = "els => els.map(e => e.getAttribute('href'))"
+# The same as a page-global helper, installed once per context by the async
+# scraper so V8 compiles it once; GRAB_HREFS_JS falls back to an inline
+# query on pages where the helper is missing
+GRAB_HREFS_INIT_JS = (
+    "window.__grabHrefs = sel => Array.from(document.querySelectorAll(sel), e => e.getAttribute('href'))"
+)
+GRAB_HREFS_JS = (
+    "sel => window.__grabHrefs ? window.__grabHrefs(sel)"
+    " : Array.from(document.querySelectorAll(sel), e => e.getAttribute('href'))"
+)
+
 COMMENT_SELECTORS = [
     'ul li a[href^="/"]',
     'div[role="button"] a[href^="/"]',
@@ -61,19 +91,75 @@ def is_valid_username(username: str, logged_in_user: str = None) -> bool:
     return True
 
 
+def owner_from_meta(meta: str | None) -> str | None:
+    """Post owner named in an og:description meta tag ("... @name ..."), if any."""
+    if meta and '@' in meta:
+        match = META_AT_RE.search(meta)
+        if match:
+            return match.group(1)
+    return None
+
+
+def owner_from_title(title: str | None) -> str | None:
+    """Post owner named in a "<name> on Instagram" page title, if any."""
+    if title and ' on Instagram' in title:
+        username = title.split(' on Instagram')[0].strip()
+        if USERNAME_CHARS_RE.match(username):
+            return username
+    return None
+
+
+def usernames_in_html(html: str) -> list[str]:
+    """Usernames of every profile link in *html*, in page order, repeats kept."""
+    return [u for u in HREF_USER_RE.findall(html) if f"/{u}/" not in EXCLUDED_PATHS]
+
+
+def usernames_in_hrefs(hrefs: list[str]) -> list[str]:
+    """Same as :func:`usernames_in_html` for a list of href strings."""
+    usernames = []
+    for href in hrefs:
+        # USERNAME_PATTERN only matches single-segment paths, so nothing under
+        # a section (/p/..., /explore/...) gets through; only the section
+        # roots themselves need the EXCLUDED_PATHS check
+        if not href or href in EXCLUDED_PATHS:
+            continue
+        match = USERNAME_PATTERN.match(href)
+        if match:
+            usernames.append(match.group(1))
+    return usernames
+
+
+def most_frequent(items: list[str]) -> str | None:
+    """Most common item, ties going to the first seen; None when empty."""
+    counts: dict[str, int] = {}
+    for item in items:
+        counts[item] = counts.get(item, 0) + 1
+    return max(counts, key=counts.get) if counts else None
+
+
 def get_delay(action: str = "default") -> tuple[float, float]:
     """Return (min_sec, max_sec) for a given action."""
     return DELAY_MAP.get(action, DELAY_MAP["default"])
 
 
+def next_delay(action: str = "default") -> float:
+    """Next jittered delay for an action, drawn DELAY_POOL_SIZE at a time."""
+    try:
+        return _delay_pools[action].pop()
+    except (KeyError, IndexError):
+        min_sec, max_sec = get_delay(action)
+        pool = [random.uniform(min_sec, max_sec) for _ in range(DELAY_POOL_SIZE)]
+        _delay_pools[action] = pool
+        return pool.pop()
+
+
 async def human_delay(action: str = "default"):
-    min_sec, max_sec = get_delay(action)
-    await asyncio.sleep(random.uniform(min_sec, max_sec))
+    await asyncio.sleep(next_delay(action))
 
 
-async def maybe_take_break():
+async def maybe_take_break(log=print):
     if random.random() < 0.2:
-        print("      [Taking a short break...]")
+        log("      [Taking a short break...]")
         await asyncio.sleep(random.uniform(8, 15))
 
 
@@ -83,13 +169,15 @@ async def login_and_save_session(browser_type: BrowserType = DEFAULT_BROWSER):
 
 
 class InstagramScraper:
-    def __init__(self, target_customer: str, cookies: list[dict], headless: bool = DEFAULT_HEADLESS, max_commenters: int = MAX_COMMENTERS_PER_POST, browser_type: BrowserType = DEFAULT_BROWSER):
+    def __init__(self, target_customer: str, cookies: list[dict], headless: bool = DEFAULT_HEADLESS, max_commenters: int = MAX_COMMENTERS_PER_POST, browser_type: BrowserType = DEFAULT_BROWSER, log_callback=None):
         self.headless = headless
         self.target_customer = target_customer
         self.cookies = cookies
         self.config = get_target_config(target_customer)
         self.max_commenters = max_commenters
         self.browser_type = browser_type
+        # Progress lines are queued and written by a background thread
+        self.log = create_log_function(log_callback)
         
         if not self.config:
             raise ValueError(f"Unknown target customer: {target_customer}")
@@ -101,52 +189,52 @@ class InstagramScraper:
         self.system_usernames = SYSTEM_USERNAMES
     
     def _is_valid_username(self, username: str) -> bool:
-        return is_valid_username(username, self.logged_in_user)
+        return bool(username) and username not in self.system_usernames and username != self.logged_in_user
     
-    async def _extract_post_owner(self, page) -> str | None:
+    async def _quick_post_owner(self, page) -> tuple[str | None, str | None]:
+        """Strategies 1-2: return (owner, "meta" | "title"), or (None, None)."""
         # Strategy 1: Meta tags
         try:
             meta = await page.get_attribute('meta[property="og:description"]', 'content')
-            if meta and '@' in meta:
-                match = re.search(r'@([a-zA-Z0-9_.]+)', meta)
-                if match and self._is_valid_username(match.group(1)):
-                    return match.group(1)
+            owner = owner_from_meta(meta)
+            if owner and self._is_valid_username(owner):
+                return owner, "meta"
         except:
             pass
         
         # Strategy 2: Page title
         try:
-            title = await page.title()
-            if title and ' on Instagram' in title:
-                username = title.split(' on Instagram')[0].strip()
-                if re.match(r'^[a-zA-Z0-9_.]+$', username) and self._is_valid_username(username):
-                    return username
+            owner = owner_from_title(await page.title())
+            if owner and self._is_valid_username(owner):
+                return owner, "title"
         except:
             pass
         
-        # Strategy 3: Link scanning
-        all_links = await page.query_selector_all('a[href^="/"]')
-        candidates = []
+        return None, None
+    
+    async def _extract_post_owner(self, page) -> str | None:
+        owner, source = await self._quick_post_owner(page)
+        if source:
+            return owner
         
-        for link in all_links:
-            href = await link.get_attribute("href")
-            if not href or href in EXCLUDED_PATHS:
-                continue
-            if any(href.startswith(ex) for ex in ['/explore/', '/p/', '/reel/', '/tags/']):
-                continue
-            
-            match = USERNAME_PATTERN.match(href)
-            if match:
-                username = match.group(1)
-                if self._is_valid_username(username):
-                    candidates.append(username)
-                elif not self.logged_in_user and username not in self.system_usernames:
-                    self.logged_in_user = username
+        # Strategy 3: Link scanning, as one regex pass over the page HTML
+        # (reading the links through the DOM only if that comes back empty)
+        html = await page.content()
+        if html:
+            usernames = usernames_in_html(html)
+        else:
+            usernames = usernames_in_hrefs(await page.evaluate(GRAB_HREFS_JS, 'a[href^="/"]'))
+        candidates = []
+        # Locals for the per-link checks; usernames here are never empty
+        system_usernames, logged_in_user = self.system_usernames, self.logged_in_user
         
-        if candidates:
-            return Counter(candidates).most_common(1)[0][0]
+        for username in usernames:
+            if username not in system_usernames and username != logged_in_user:
+                candidates.append(username)
+            elif not logged_in_user and username not in system_usernames:
+                self.logged_in_user = logged_in_user = username
         
-        return None
+        return most_frequent(candidates)
     
     async def _scroll_comments(self, page) -> None:
         """Scroll through comment section to load more comments."""
@@ -161,7 +249,7 @@ class InstagramScraper:
                         if btn:
                             await btn.click()
                             clicked = True
-                            print(f"        Loaded more comments ({scroll_num + 1}/{MAX_COMMENT_SCROLLS})")
+                            self.log(f"        Loaded more comments ({scroll_num + 1}/{MAX_COMMENT_SCROLLS})")
                             await human_delay("comment_scroll")
                             break
                     except:
@@ -182,7 +270,7 @@ class InstagramScraper:
                 if random.random() < 0.3:
                     break
                 
-                await maybe_take_break()
+                await maybe_take_break(self.log)
                 
         except Exception as e:
             pass
@@ -200,20 +288,19 @@ class InstagramScraper:
                 if len(commenters) >= self.max_commenters:
                     break
                 
-                links = await page.query_selector_all(selector)
+                hrefs = await page.evaluate(GRAB_HREFS_JS, selector)
                 
-                for link in links:
+                for href in hrefs:
                     if len(commenters) >= self.max_commenters:
                         break
                     
-                    href = await link.get_attribute("href")
                     if not href:
                         continue
                     
-                    match = USERNAME_PATTERN.match(href)
+                    match = VALID_USERNAME_RE.match(href)
                     if match:
                         username = match.group(1)
-                        if (self._is_valid_username(username) and 
+                        if (username != self.logged_in_user and 
                             username != post_owner and 
                             username not in seen_usernames):
                             seen_usernames.add(username)
@@ -221,27 +308,26 @@ class InstagramScraper:
             
             # Strategy 2: Scan all article links as fallback
             if len(commenters) < 3:
-                all_links = await page.query_selector_all('article a[href^="/"]')
+                hrefs = await page.evaluate(GRAB_HREFS_JS, 'article a[href^="/"]')
                 
-                for link in all_links:
+                for href in hrefs:
                     if len(commenters) >= self.max_commenters:
                         break
                     
-                    href = await link.get_attribute("href")
                     if not href:
                         continue
                     
-                    match = USERNAME_PATTERN.match(href)
+                    match = VALID_USERNAME_RE.match(href)
                     if match:
                         username = match.group(1)
-                        if (self._is_valid_username(username) and 
+                        if (username != self.logged_in_user and 
                             username != post_owner and 
                             username not in seen_usernames):
                             seen_usernames.add(username)
                             commenters.append(username)
                             
         except Exception as e:
-            print(f"        Comment extraction error: {e}")
+            self.log(f"        Comment extraction error: {e}")
         
         return commenters[:self.max_commenters]
     
@@ -253,7 +339,7 @@ class InstagramScraper:
             await page.goto(post_url, wait_until="domcontentloaded")
             
             try:
-                await page.wait_for_selector('article', timeout=10000)
+                await page.wait_for_selector('article', timeout=ARTICLE_WAIT_MS)
             except:
                 pass
             
@@ -269,14 +355,14 @@ class InstagramScraper:
                     "source_hashtag": hashtag,
                     "target_customer": self.target_customer
                 })
-                print(f"      Owner: @{post_owner}")
+                self.log(f"      Owner: @{post_owner}")
                 
                 # Extract commenters with scrolling
-                print(f"      Scrolling comments...")
+                self.log(f"      Scrolling comments...")
                 commenters = await self._extract_commenters(page, post_owner)
                 
                 if commenters:
-                    print(f"      Found {len(commenters)} commenters")
+                    self.log(f"      Found {len(commenters)} commenters")
                     for commenter in commenters:
                         results.append({
                             "username": commenter,
@@ -285,80 +371,83 @@ class InstagramScraper:
                             "target_customer": self.target_customer
                         })
                 else:
-                    print(f"      No commenters found")
+                    self.log(f"      No commenters found")
             
         except Exception as e:
-            print(f"      ERROR: {e}")
+            self.log(f"      ERROR: {e}")
         
         return results
     
-    async def scrape_hashtag(self, hashtag: str) -> list[dict]:
-        """Scrape posts from a hashtag page."""
+    async def scrape_hashtag(self, page, hashtag: str) -> list[dict]:
+        """Scrape posts from a hashtag page, using *page* and new tabs in its context."""
         users = []
+        seen_usernames: set[str] = set()
+        context = page.context
         
-        async with async_playwright() as p:
-            browser, context, page = await launch_with_cookies_async(
-                p,
-                self.cookies,
-                browser_type=self.browser_type,
-                headless=self.headless,
-            )
-            
-            url = f"https://www.instagram.com/explore/tags/{hashtag}/"
-            print(f"  Visiting #{hashtag}...")
-            await page.goto(url, wait_until="domcontentloaded")
-            
-            try:
-                await page.wait_for_load_state("networkidle", timeout=10000)
-            except:
-                pass
-            
-            await human_delay("page_load")
-            
-            if "login" in page.url.lower():
-                print("  WARNING: Redirected to login!")
-                await context.close()
-                if browser:
-                    await browser.close()
-                return users
-            
-            for _ in range(random.randint(1, 2)):
-                await page.keyboard.press("PageDown")
-                await human_delay("scroll")
-            
-            await maybe_take_break()
-            
-            post_links = await page.query_selector_all('a[href*="/p/"]')
-            post_urls = []
-            
-            for link in post_links[:MAX_POSTS_PER_HASHTAG * 2]:
-                href = await link.get_attribute("href")
-                if href and "/p/" in href:
-                    full_url = f"https://www.instagram.com{href}" if href.startswith("/") else href
-                    if full_url not in post_urls:
-                        post_urls.append(full_url)
-                        if len(post_urls) >= MAX_POSTS_PER_HASHTAG:
-                            break
-            
-            print(f"  Found {len(post_urls)} posts")
-            
-            for i, post_url in enumerate(post_urls):
+        url = f"https://www.instagram.com/explore/tags/{hashtag}/"
+        self.log(f"  Visiting #{hashtag}...")
+        await page.goto(url, wait_until="domcontentloaded")
+        
+        try:
+            await page.wait_for_load_state("networkidle", timeout=10000)
+        except:
+            pass
+        
+        await human_delay("page_load")
+        
+        if "login" in page.url.lower():
+            self.log("  WARNING: Redirected to login!")
+            return users
+        
+        for _ in range(random.randint(1, 2)):
+            await page.keyboard.press("PageDown")
+            await human_delay("scroll")
+        
+        await maybe_take_break(self.log)
+        
+        post_hrefs = await page.evaluate(GRAB_HREFS_JS, 'a[href*="/p/"]')
+        post_urls = []
+        
+        for href in post_hrefs[:MAX_POSTS_PER_HASHTAG * 2]:
+            if href and "/p/" in href:
+                full_url = f"https://www.instagram.com{href}" if href.startswith("/") else href
+                if full_url not in post_urls:
+                    post_urls.append(full_url)
+                    if len(post_urls) >= MAX_POSTS_PER_HASHTAG:
+                        break
+        
+        self.log(f"  Found {len(post_urls)} posts")
+        
+        # A few posts at a time, each in its own tab of the same context;
+        # every slot keeps the human delays between its posts
+        sem = asyncio.Semaphore(POST_CONCURRENCY)
+        
+        async def scrape_one(i: int, post_url: str) -> None:
+            async with sem:
                 if self.collected_count >= MAX_ACCOUNTS_PER_SESSION:
-                    break
+                    return
                 
-                print(f"    Post {i+1}/{len(post_urls)}...")
-                post_results = await self.scrape_post(page, post_url, hashtag)
+                self.log(f"    Post {i+1}/{len(post_urls)}...")
+                post_page = await context.new_page()
+                try:
+                    post_results = await self.scrape_post(post_page, post_url, hashtag)
+                finally:
+                    await post_page.close()
                 
+                # Other posts may have filled the session while this one ran;
+                # re-check the cap per result so it is never overshot
                 for result in post_results:
-                    if result["username"] not in [u["username"] for u in users]:
+                    if self.collected_count >= MAX_ACCOUNTS_PER_SESSION:
+                        break
+                    if result["username"] not in seen_usernames:
+                        seen_usernames.add(result["username"])
                         users.append(result)
                         self.collected_count += 1
                 
                 await human_delay("between_posts")
-                await maybe_take_break()
-            
-            await context.close()
-            await browser.close()
+                await maybe_take_break(self.log)
+        
+        await asyncio.gather(*(scrape_one(i, u) for i, u in enumerate(post_urls)))
         
         return users
     
@@ -372,26 +461,38 @@ class InstagramScraper:
             min(MAX_HASHTAGS_PER_SESSION, len(self.hashtags))
         )
         
-        print(f"\nTarget: {self.config['name']}")
-        print(f"Hashtags: {session_hashtags}")
-        print(f"Max accounts: {MAX_ACCOUNTS_PER_SESSION}")
-        print(f"Max commenters per post: {self.max_commenters}")
+        self.log(f"\nTarget: {self.config['name']}")
+        self.log(f"Hashtags: {session_hashtags}")
+        self.log(f"Max accounts: {MAX_ACCOUNTS_PER_SESSION}")
+        self.log(f"Max commenters per post: {self.max_commenters}")
         
-        for hashtag in session_hashtags:
-            if self.collected_count >= MAX_ACCOUNTS_PER_SESSION:
-                break
-            
-            users = await self.scrape_hashtag(hashtag)
-            
-            for user in users:
-                if user["username"] not in seen:
-                    seen.add(user["username"])
-                    all_users.append(user)
-            
-            if hashtag != session_hashtags[-1]:
-                print("  Waiting before next hashtag...")
-                await human_delay("between_hashtags")
+        # One browser for the whole session; each hashtag reuses its page
+        async with async_playwright() as p, session_with_cookies_async(
+            p,
+            self.cookies,
+            browser_type=self.browser_type,
+            headless=self.headless,
+            goto_url=None,
+            block_media=True,
+        ) as page:
+            await page.context.add_init_script(GRAB_HREFS_INIT_JS)
+            last_idx = len(session_hashtags) - 1
+            for i, hashtag in enumerate(session_hashtags):
+                if self.collected_count >= MAX_ACCOUNTS_PER_SESSION:
+                    break
+                
+                users = await self.scrape_hashtag(page, hashtag)
+                
+                for user in users:
+                    if user["username"] not in seen:
+                        seen.add(user["username"])
+                        all_users.append(user)
+                
+                if i != last_idx:
+                    self.log("  Waiting before next hashtag...")
+                    await human_delay("between_hashtags")
         
+        self.log.flush()
         return all_users
 
 
@@ -1,28 +1,32 @@
 import os
-import csv
 import random
-import re
 import time
-from collections import Counter
 
 from agents.ollama_brain import analyze_accounts
 from output.csv_export import export_to_csv
 from config.targets import get_target_config
+from utils.bloom import BloomFilter
 from browser.search_engine import perform_search
 
 # Reuse all shared constants and helpers from scraper.py — single source of truth
 from browser.scraper import (
-    USERNAME_PATTERN,
+    VALID_USERNAME_RE,
     MAX_ACCOUNTS_PER_SESSION,
     MAX_HASHTAGS_PER_SESSION,
     MAX_POSTS_PER_HASHTAG,
     MAX_COMMENTERS_PER_POST,
     MAX_COMMENT_SCROLLS,
-    EXCLUDED_PATHS,
+    ARTICLE_WAIT_MS,
     VIEW_MORE_SELECTORS,
     COMMENT_SELECTORS,
+    HREFS_JS,
     is_valid_username,
-    get_delay,
+    owner_from_meta,
+    owner_from_title,
+    most_frequent,
+    usernames_in_html,
+    usernames_in_hrefs,
+    next_delay,
 )
 
 
@@ -33,8 +37,7 @@ from browser.scraper import (
 
 def _human_delay_sync(action: str = "default"):
     """Sync version of human_delay using the shared delay map."""
-    min_sec, max_sec = get_delay(action)
-    time.sleep(random.uniform(min_sec, max_sec))
+    time.sleep(next_delay(action))
 
 
 def _maybe_take_break_sync(log=print):
@@ -50,45 +53,43 @@ def _maybe_take_break_sync(log=print):
 #  selectors, constants) are imported from scraper.py.
 # =====================================================================
 
-def _extract_post_owner(page, logged_in_user: str = None) -> str | None:
-    """Extract the post owner from the current page (sync)."""
+def _quick_post_owner(page, logged_in_user: str = None) -> tuple[str | None, str | None]:
+    """Strategies 1-2 (sync): return (owner, "meta" | "title"), or (None, None)."""
     # Strategy 1: Meta tag
     try:
-        meta = page.get_attribute('meta[property="og:description"]', 'content')
-        if meta and '@' in meta:
-            match = re.search(r'@([a-zA-Z0-9_.]+)', meta)
-            if match and is_valid_username(match.group(1), logged_in_user):
-                return match.group(1)
+        owner = owner_from_meta(page.get_attribute('meta[property="og:description"]', 'content'))
+        if owner and is_valid_username(owner, logged_in_user):
+            return owner, "meta"
     except:
         pass
 
     # Strategy 2: Page title
     try:
-        title = page.title()
-        if title and ' on Instagram' in title:
-            username = title.split(' on Instagram')[0].strip()
-            if re.match(r'^[a-zA-Z0-9_.]+$', username) and is_valid_username(username, logged_in_user):
-                return username
+        owner = owner_from_title(page.title())
+        if owner and is_valid_username(owner, logged_in_user):
+            return owner, "title"
     except:
         pass
 
-    # Strategy 3: Link scanning
+    return None, None
+
+
+def _extract_post_owner(page, logged_in_user: str = None) -> str | None:
+    """Extract the post owner from the current page (sync)."""
+    owner, source = _quick_post_owner(page, logged_in_user)
+    if source:
+        return owner
+
+    # Strategy 3: Link scanning, as one regex pass over the page HTML
     try:
-        all_links = page.query_selector_all('a[href^="/"]')
-        candidates = []
-        for link in all_links:
-            href = link.get_attribute("href")
-            if not href or href in EXCLUDED_PATHS:
-                continue
-            if any(href.startswith(ex) for ex in ['/explore/', '/p/', '/reel/', '/tags/']):
-                continue
-            match = USERNAME_PATTERN.match(href)
-            if match:
-                uname = match.group(1)
-                if is_valid_username(uname, logged_in_user):
-                    candidates.append(uname)
+        html = page.content()
+        if html:
+            usernames = usernames_in_html(html)
+        else:
+            usernames = usernames_in_hrefs(page.eval_on_selector_all('a[href^="/"]', HREFS_JS))
+        candidates = [uname for uname in usernames if is_valid_username(uname, logged_in_user)]
         if candidates:
-            return Counter(candidates).most_common(1)[0][0]
+            return most_frequent(candidates)
     except:
         pass
 
@@ -141,17 +142,16 @@ def _extract_commenters(page, post_owner: str, max_commenters: int = MAX_COMMENT
         if len(commenters) >= max_commenters:
             break
         try:
-            links = page.query_selector_all(selector)
-            for link in links:
+            hrefs = page.eval_on_selector_all(selector, HREFS_JS)
+            for href in hrefs:
                 if len(commenters) >= max_commenters:
                     break
-                href = link.get_attribute("href")
                 if not href:
                     continue
-                match = USERNAME_PATTERN.match(href)
+                match = VALID_USERNAME_RE.match(href)
                 if match:
                     uname = match.group(1)
-                    if is_valid_username(uname) and uname != post_owner and uname not in seen:
+                    if uname != post_owner and uname not in seen:
                         seen.add(uname)
                         commenters.append(uname)
         except:
@@ -160,17 +160,16 @@ def _extract_commenters(page, post_owner: str, max_commenters: int = MAX_COMMENT
     # fallback: scan all article links
     if len(commenters) < 3:
         try:
-            all_links = page.query_selector_all('article a[href^="/"]')
-            for link in all_links:
+            hrefs = page.eval_on_selector_all('article a[href^="/"]', HREFS_JS)
+            for href in hrefs:
                 if len(commenters) >= max_commenters:
                     break
-                href = link.get_attribute("href")
                 if not href:
                     continue
-                match = USERNAME_PATTERN.match(href)
+                match = VALID_USERNAME_RE.match(href)
                 if match:
                     uname = match.group(1)
-                    if is_valid_username(uname) and uname != post_owner and uname not in seen:
+                    if uname != post_owner and uname not in seen:
                         seen.add(uname)
                         commenters.append(uname)
         except:
@@ -186,14 +185,14 @@ def _extract_commenters(page, post_owner: str, max_commenters: int = MAX_COMMENT
 def scrape_hashtags_sync(page, target_customer: str,
                          max_commenters: int = MAX_COMMENTERS_PER_POST,
                          log=print,
-                         visited_posts: set = None) -> list[dict]:
+                         visited_posts: set[str] | BloomFilter | None = None) -> list[dict]:
     """
     Navigate to hashtag pages and scrape post owners + commenters.
     Uses the ALREADY-OPEN sync playwright page (same browser session the
     scrolling loop is using).
 
-    visited_posts: a persistent set of post URLs already scraped.
-                   Posts in this set will be skipped. New posts are added to it.
+    visited_posts: a persistent set (or utils.bloom.BloomFilter) of post URLs
+                   already scraped. Posts in it will be skipped. New posts are added to it.
 
     Returns a list of dicts: [{username, source, source_hashtag, target_customer}, ...]
     """
@@ -214,7 +213,8 @@ def scrape_hashtags_sync(page, target_customer: str,
     seen: set[str] = set()
     collected = 0
 
-    for hashtag in session_hashtags:
+    last_idx = len(session_hashtags) - 1
+    for idx, hashtag in enumerate(session_hashtags):
         if collected >= MAX_ACCOUNTS_PER_SESSION:
             break
 
@@ -241,10 +241,9 @@ def scrape_hashtags_sync(page, target_customer: str,
                 _human_delay_sync("scroll")
 
             # collect post links
-            post_links = page.query_selector_all('a[href*="/p/"]')
+            post_hrefs = page.eval_on_selector_all('a[href*="/p/"]', HREFS_JS)
             post_urls = []
-            for link in post_links[:MAX_POSTS_PER_HASHTAG * 2]:
-                href = link.get_attribute("href")
+            for href in post_hrefs[:MAX_POSTS_PER_HASHTAG * 2]:
                 if href and "/p/" in href:
                     full_url = f"https://www.instagram.com{href}" if href.startswith("/") else href
                     if full_url not in post_urls:
@@ -255,9 +254,13 @@ def scrape_hashtags_sync(page, target_customer: str,
             # Filter out already-visited posts
             new_post_urls = [u for u in post_urls if u not in visited_posts]
             skipped = len(post_urls) - len(new_post_urls)
-            if skipped > 0:
-                log(f"  ⏭️ Skipping {skipped} already-scraped posts")
-            log(f"  📝 {len(new_post_urls)} new posts to scrape")
+            if post_urls and not new_post_urls:
+                # Nothing to open; the wait between hashtags below still runs
+                log("  ⏭️ All posts already seen, skipping hashtag")
+            else:
+                if skipped > 0:
+                    log(f"  ⏭️ Skipping {skipped} already-scraped posts")
+                log(f"  📝 {len(new_post_urls)} new posts to scrape")
 
             for i, post_url in enumerate(new_post_urls):
                 if collected >= MAX_ACCOUNTS_PER_SESSION:
@@ -270,7 +273,7 @@ def scrape_hashtags_sync(page, target_customer: str,
                 try:
                     page.goto(post_url, wait_until="domcontentloaded")
                     try:
-                        page.wait_for_selector('article', timeout=10000)
+                        page.wait_for_selector('article', timeout=ARTICLE_WAIT_MS)
                     except:
                         pass
                     _human_delay_sync("read_content")
@@ -315,7 +318,7 @@ def scrape_hashtags_sync(page, target_customer: str,
             log(f"  ❌ Hashtag error: {e}")
 
         # wait between hashtags
-        if hashtag != session_hashtags[-1]:
+        if idx != last_idx:
             log("  ⏳ Waiting before next hashtag...")
             _human_delay_sync("between_hashtags")
 
@@ -331,7 +334,7 @@ def run_scraper_pipeline_sync(page, target_customer: str,
                               max_commenters: int = MAX_COMMENTERS_PER_POST,
                               model: str = "llama3:8b",
                               log=print,
-                              visited_posts: set = None) -> list[str]:
+                              visited_posts: set[str] | BloomFilter | None = None) -> list[str]:
     """
     Run the complete scraper pipeline on the existing sync page:
       1. scrape hashtag pages for usernames (skipping already-visited posts)
@@ -339,7 +342,9 @@ def run_scraper_pipeline_sync(page, target_customer: str,
       3. export to CSV
       4. return the username list
 
-    visited_posts: persistent set of post URLs already scraped (shared across runs).
+    visited_posts: post URLs already scraped, shared across runs — a set, or the
+                   fixed-size utils.bloom.BloomFilter the hybrid session loads from
+                   and saves to disk.
     The caller (hybrid.py) is responsible for visiting each username
     via search_engine.perform_search afterwards.
     """
@@ -380,17 +385,8 @@ def run_scraper_pipeline_sync(page, target_customer: str,
     csv_path = export_to_csv(results, target_customer)
     log(f"💾 [Export] Saved to: {csv_path}")
 
-    # Step 4 — extract username column
-    usernames: list[str] = []
-    try:
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                uname = row.get("username", "").strip()
-                if uname:
-                    usernames.append(uname)
-    except Exception as e:
-        log(f"❌ Error reading CSV: {e}")
+    # Step 4 — unique usernames, taken from the results in memory
+    usernames = [u.strip() for u in dict.fromkeys(r.get("username", "") for r in results) if u.strip()]
 
     log(f"\n✅ Pipeline complete! {len(usernames)} usernames ready for visiting")
     log("=" * 50 + "\n")
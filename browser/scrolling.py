@@ -1,6 +1,9 @@
 from playwright.sync_api import sync_playwright
+from weakref import WeakKeyDictionary
 import time
+import queue
 import random
+import threading
 from browser.launcher import (
     launch_with_cookies,
     BrowserType,
@@ -8,13 +11,100 @@ from browser.launcher import (
     DEFAULT_HEADLESS,
 )
 
-def create_log_function(log_callback):
-    def log(msg):
-        if log_callback:
-            log_callback(msg)
+# Locators cached per page so repeated lookups of the same selector reuse one
+# Locator (and its parsed selector) instead of rebuilding it on every call.
+# Locators stay valid across navigations. Weak keys cannot be confused with a
+# recycled id(); since each Locator refers back to its page, entries are also
+# dropped explicitly when the page closes so the page can be collected.
+_LOCATOR_CACHE: "WeakKeyDictionary[object, dict]" = WeakKeyDictionary()
+
+
+def get_locator(page, selector):
+    """Cached ``page.locator``; a tuple of selectors yields one locator matching any of them."""
+    cache = _LOCATOR_CACHE.get(page)
+    if cache is None:
+        cache = _LOCATOR_CACHE[page] = {}
+        page.on("close", lambda closed: _LOCATOR_CACHE.pop(closed, None))
+    locator = cache.get(selector)
+    if locator is None:
+        if isinstance(selector, tuple):
+            locator = page.locator(selector[0])
+            for alternative in selector[1:]:
+                locator = locator.or_(page.locator(alternative))
         else:
-            print(msg)
-    return log
+            locator = page.locator(selector)
+        cache[selector] = locator
+    return locator
+
+
+class BufferedLog:
+    """
+    Callable logger returned by :func:`create_log_function`.
+
+    ``log(msg)`` and ``log.debug(fmt, *args)`` only enqueue; a daemon
+    thread, started on demand and exiting once idle, formats and hands the
+    entries to the real callback in order, so a slow print or GUI/task-log
+    callback never stalls the scroll loop. ``debug`` is for per-iteration
+    chatter: it is skipped entirely when nobody consumes it and otherwise
+    %-formatted lazily on the consumer thread. :meth:`flush` blocks until
+    everything queued so far has been emitted.
+    """
+    DEBUG = 10
+    INFO = 20
+    IDLE_TIMEOUT = 1.0
+
+    def __init__(self, log_callback=None, level=None):
+        self._emit = log_callback or print
+        # Only a real consumer (task log / GUI callback) gets debug lines by default
+        self.level = level if level is not None else (self.DEBUG if log_callback else self.INFO)
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker = None
+
+    def __call__(self, msg):
+        self._put((msg, ()))
+
+    def debug(self, fmt, *args):
+        if self.level > self.DEBUG:
+            return
+        self._put((fmt, args))
+
+    def flush(self):
+        self._queue.join()
+
+    def _put(self, entry):
+        with self._lock:
+            self._queue.put_nowait(entry)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._drain, name="log-writer", daemon=True)
+                self._worker.start()
+
+    def _drain(self):
+        q = self._queue
+        while True:
+            try:
+                fmt, args = q.get(timeout=self.IDLE_TIMEOUT)
+            except queue.Empty:
+                with self._lock:
+                    # Anything put after the timeout is seen here, or starts a new worker
+                    if q.empty():
+                        self._worker = None
+                        return
+                continue
+            try:
+                self._emit(fmt % args if args else fmt)
+            except Exception:
+                pass
+            finally:
+                q.task_done()
+
+
+LIKE_SELECTOR = 'svg[aria-label="Like"]:visible'
+MAX_LIKE_CANDIDATES = 8
+
+
+def create_log_function(log_callback):
+    return BufferedLog(log_callback)
 
 def human_mouse_move(page, element):
     # Get element bounding box
@@ -37,18 +127,42 @@ def create_stop_checker(stop_flag):
     return should_stop
 
 
+def press_and_pause(page, key, pause_range, selector='body'):
+    """Press *key*, then pause for a random human delay.
+
+    The delay clock starts before the press, so the Playwright round-trip
+    is absorbed into the pause instead of being added on top of it.
+    """
+    deadline = time.monotonic() + random.uniform(pause_range[0], pause_range[1])
+    page.press(selector, key)
+    remaining = deadline - time.monotonic()
+    if remaining > 0:
+        time.sleep(remaining)
+
+
+# Up-then-down "re-read" wiggle with both pauses, in a single round-trip
+WIGGLE_JS = """
+async ({upPause, downPause}) => {
+    const step = window.innerHeight * 0.875;
+    const sleep = (ms) => new Promise(r => setTimeout(r, ms));
+    window.scrollBy(0, -step);
+    await sleep(upPause);
+    window.scrollBy(0, step);
+    await sleep(downPause);
+}
+"""
+
+
 def do_single_scroll(page, log=print, scroll_up_chance=0.30):
-    page.press('body', 'PageDown')
-    pause_time = random.uniform(0.8, 1.5)
-    page.wait_for_timeout(int(pause_time * 1000))
+    press_and_pause(page, 'PageDown', (0.8, 1.5))
     
     # Chance to scroll up for natural behavior
     did_scroll_up = False
     if random.uniform(0, 1) < scroll_up_chance:
-        page.press('body', 'PageUp')
-        time.sleep(random.uniform(0.5, 1.0))
-        page.press('body', 'PageDown')
-        time.sleep(random.uniform(0.3, 0.7))
+        page.evaluate(WIGGLE_JS, {
+            'upPause': random.uniform(500, 1000),
+            'downPause': random.uniform(300, 700),
+        })
         did_scroll_up = True
     
     return did_scroll_up
@@ -58,11 +172,12 @@ def try_random_like(page, like_chance_range=(0.10, 0.15), log=print):
 
     if random.uniform(0, 1) < random.uniform(like_chance_range[0], like_chance_range[1]):
         try:
-            like_buttons = page.query_selector_all('svg[aria-label="Like"]')
-            if like_buttons:
-                random_button = random.choice(like_buttons)
+            # Only on-screen hearts, and only a handful of them, are considered
+            like_buttons = get_locator(page, LIKE_SELECTOR)
+            count = min(like_buttons.count(), MAX_LIKE_CANDIDATES)
+            if count:
                 try:
-                    random_button.click(timeout=200)
+                    like_buttons.nth(random.randrange(count)).click(timeout=200, force=True)
                     time.sleep(0.5)
                     return True
                 except:
@@ -104,6 +219,67 @@ def launch_instagram_browser(playwright, cookies: list[dict], headless=DEFAULT_H
     return browser, context, page
 
 
+class BrowserPool:
+    """
+    Keeps one Playwright driver, browser and cookie-loaded context alive
+    across scroll sessions (e.g. every cycle of infinite mode), so only a
+    fresh page is opened per session instead of a cold browser launch.
+    """
+
+    def __init__(self, cookies: list[dict], headless=DEFAULT_HEADLESS, log=print, browser_type: BrowserType = DEFAULT_BROWSER):
+        self.cookies = cookies
+        self.headless = headless
+        self.log = log
+        self.browser_type = browser_type
+        self._pw = None
+        self._browser = None
+        self._context = None
+        self._first_page = None
+
+    def acquire(self):
+        """Return a page on the Instagram feed, launching the browser on first use."""
+        if self._context is None:
+            self._pw = sync_playwright().start()
+            self._browser, self._context, self._first_page = launch_instagram_browser(
+                self._pw, self.cookies, self.headless, self.log, browser_type=self.browser_type
+            )
+            return self._first_page
+
+        page = self._context.new_page()
+        page.goto("https://www.instagram.com")
+        try:
+            page.click('xpath=//main')
+        except:
+            pass
+        return page
+
+    def release(self, page):
+        """Close a page handed out by :meth:`acquire`; the browser stays up."""
+        try:
+            page.close()
+        except:
+            pass
+
+    def close(self):
+        self.log("Closing browser...")
+        for closer in (self._context, self._browser):
+            if closer is not None:
+                try:
+                    closer.close()
+                except:
+                    pass
+        if self._pw is not None:
+            self._pw.stop()
+        self._pw = self._browser = self._context = self._first_page = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
 def run_timed_scroll_loop(page, duration, should_stop, log=print, on_scroll_callback=None):
     start_time = time.time()
     scroll_count = 0
@@ -174,7 +350,8 @@ def run_infinite_mode(run_session_func, should_stop, log=print,
         
         log(f"\n{'='*40}")
         log(f"REST TIME - Taking a break for {rest_mins} minutes")
-        log(f"💤 Browser closed, script still running...")
+        # Pooled sessions keep their browser open through the rest
+        log(f"💤 No activity until the break ends, script still running...")
         log(f"{'='*40}")
         
         # Rest period
@@ -237,3 +414,4 @@ def run_instagram_scroll(cookies: list[dict], duration=60, stop_flag=None, log_c
         run_scroll_session(duration)
     
     log("✅ Done!")
+    log.flush()
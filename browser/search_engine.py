@@ -1,7 +1,8 @@
 from playwright.sync_api import sync_playwright
+import re
 import time
 import random
-from browser.scrolling import human_mouse_move
+from browser.scrolling import human_mouse_move, get_locator
 from browser.launcher import (
     launch_with_cookies,
     BrowserType,
@@ -9,32 +10,51 @@ from browser.launcher import (
     DEFAULT_HEADLESS,
 )
 
+# Search-flow elements are waited for (visible) instead of slept for; the
+# short random pauses left below are the human hover/typing cadence.
+# Alternatives are merged into one CSS selector list and one xpath union,
+# so each locator is at most a two-way or_() resolved in a single query.
+SEARCH_BUTTON_SELECTORS = (
+    'a[href="#"]:has(svg[aria-label="Search"]), [role="link"]:has(svg[aria-label="Search"])',
+    'xpath=//a[.//svg[@aria-label="Search"]]'
+    ' | //span[text()="Search"]/ancestor::a'
+    ' | //div[contains(@class, "x1n2onr6")]//a[.//svg[@aria-label="Search"]]'
+    ' | //svg[@aria-label="Search"]/ancestor::a[1]'
+    ' | //*[@aria-label="Search" or @aria-label="search"]',
+)
+SEARCH_INPUT_SELECTORS = (
+    'input[placeholder="Search"], input[aria-label="Search input"],'
+    ' input[type="text"][placeholder*="Search"], input[aria-label*="Search"]',
+)
+HASHTAG_RESULT_SELECTORS = (
+    'a[href*="/explore/tags/"]',
+    'xpath=//span[contains(text(), "#")]/ancestor::a',
+)
+USER_RESULT_SELECTORS = (
+    'xpath=//a[contains(@href, "/") and not(contains(@href, "/explore/"))] | //div[@role="none"]//a',
+)
+SEARCH_BUTTON_TIMEOUT_MS = 5000
+SEARCH_INPUT_TIMEOUT_MS = 5000
+SEARCH_RESULT_TIMEOUT_MS = 6000
+# Terms that can be matched against a result href verbatim
+SEARCH_TERM_RE = re.compile(r'[\w.]+')
+
+
+def _wait_visible(page, selectors, timeout):
+    """First visible element matching any of *selectors*, waiting up to *timeout* ms, or None."""
+    loc = get_locator(page, selectors).locator("visible=true").first
+    if not timeout:
+        # Playwright reads timeout=0 as "wait forever"; probe once instead
+        return loc if loc.count() else None
+    try:
+        loc.wait_for(state="visible", timeout=timeout)
+        return loc
+    except:
+        return None
+
+
 def click_search_button(page, log=print):
-    
-    time.sleep(random.uniform(0.5, 1.0))
-    
-    search_button = None
-    selectors = [
-        'a[href="#"]:has(svg[aria-label="Search"])',
-        'xpath=//a[.//svg[@aria-label="Search"]]',
-        'xpath=//span[text()="Search"]/ancestor::a',
-        'xpath=//div[contains(@class, "x1n2onr6")]//a[.//svg[@aria-label="Search"]]',
-        '[role="link"]:has(svg[aria-label="Search"])',
-        'xpath=//*[@aria-label="Search" or @aria-label="search"]',
-    ]
-    
-    for selector in selectors:
-        try:
-            search_button = page.query_selector(selector)
-            if search_button:
-                break
-        except:
-            continue
-    
-    if not search_button:
-        search_button = page.query_selector('svg[aria-label="Search"]')
-        if search_button:
-            search_button = page.query_selector('xpath=//svg[@aria-label="Search"]/ancestor::a[1]')
+    search_button = _wait_visible(page, SEARCH_BUTTON_SELECTORS, SEARCH_BUTTON_TIMEOUT_MS)
     
     if search_button:
         try:
@@ -59,34 +79,16 @@ def click_search_button(page, log=print):
 
 
 def find_and_activate_search_input(page, log=print):
-    time.sleep(random.uniform(1.5, 2.5))
-    
-    search_input = None
-    input_selectors = [
-        'input[placeholder="Search"]',
-        'input[aria-label="Search input"]',
-        'input[type="text"][placeholder*="Search"]',
-        'xpath=//input[@placeholder="Search"]',
-        'xpath=//input[contains(@aria-label, "Search")]',
-    ]
-    
-    for selector in input_selectors:
-        try:
-            search_input = page.wait_for_selector(selector, timeout=3000)
-            if search_input:
-                log("Found search input!")
-                break
-        except:
-            continue
+    search_input = _wait_visible(page, SEARCH_INPUT_SELECTORS, SEARCH_INPUT_TIMEOUT_MS)
     
     if search_input:
+        log("Found search input!")
         try:
             human_mouse_move(page, search_input)
             search_input.hover()
             time.sleep(random.uniform(0.4, 0.8))
             search_input.click()
             log("Search input activated!")
-            time.sleep(random.uniform(0.5, 1.0))
             return search_input
         except Exception as e:
             log(f"Error activating search input: {e}")
@@ -94,14 +96,19 @@ def find_and_activate_search_input(page, log=print):
     return None
 
 
-def type_search_term(page, search_term, log=print):
+def type_search_term(page, search_term, log=print, search_input=None, human_typing=True):
     log(f"Typing '{search_term}'...")
     time.sleep(random.uniform(0.3, 0.7))
     
     try:
-        search_input = page.query_selector('input[placeholder="Search"]')
-        if not search_input:
-            search_input = page.query_selector('input[aria-label="Search input"]')
+        if search_input is None:
+            search_input = _wait_visible(page, SEARCH_INPUT_SELECTORS, 0)
+        
+        if search_input and not human_typing:
+            # One fill() call instead of a keystroke round-trip per character
+            search_input.fill(search_term)
+            log(f"✅ Typed: {search_term}")
+            return True
         
         if search_input:
             search_input.fill('')
@@ -110,7 +117,7 @@ def type_search_term(page, search_term, log=print):
             for char in search_term:
                 if random.random() < 0.1:
                     time.sleep(random.uniform(0.2, 0.4))
-                search_input.type(char, delay=random.uniform(80, 180))
+                search_input.press_sequentially(char, delay=random.uniform(80, 180))
                 time.sleep(random.uniform(0.03, 0.12))
             
             log(f"✅ Typed: {search_term}")
@@ -125,44 +132,49 @@ def type_search_term(page, search_term, log=print):
         return False
 
 
-def click_search_result(page, search_type="hashtag", log=print):
-    time.sleep(random.uniform(2.0, 3.0))
-    
+def _exact_result_selector(search_term, search_type):
+    """Selector for the result linking to exactly *search_term*, or None."""
+    term = (search_term or "").lstrip("#@").strip().lower()
+    if not SEARCH_TERM_RE.fullmatch(term):
+        return None
+    if search_type == "hashtag":
+        return f'a[href*="/explore/tags/{term}/"]'
+    return f'a[href="/{term}/"]'
+
+
+def click_search_result(page, search_type="hashtag", log=print, search_term=None):
     if search_type == "hashtag":
         log("Looking for hashtag results...")
-        result_selectors = [
-            'xpath=//a[contains(@href, "/explore/tags/")]',
-            'xpath=//span[contains(text(), "#")]/ancestor::a',
-        ]
+        result_selectors = HASHTAG_RESULT_SELECTORS
     else:
         log("Looking for user results...")
-        result_selectors = [
-            'xpath=//a[contains(@href, "/") and not(contains(@href, "/explore/"))]',
-            'xpath=//div[@role="none"]//a',
-        ]
+        result_selectors = USER_RESULT_SELECTORS
+    
+    # Waiting for the result that matches the typed term means a stale
+    # result list (recent searches) is never clicked while results load
+    target = None
+    exact = _exact_result_selector(search_term, search_type)
+    if exact:
+        target = _wait_visible(page, (exact,), SEARCH_RESULT_TIMEOUT_MS)
+    if target is None:
+        target = _wait_visible(page, result_selectors, 0 if exact else SEARCH_RESULT_TIMEOUT_MS)
     
-    for selector in result_selectors:
+    if target:
         try:
-            results = page.query_selector_all(selector)
-            if results:
-                visible_results = [r for r in results[:5] if r.is_visible()]
-                if visible_results:
-                    target = visible_results[0]
-                    time.sleep(random.uniform(0.3, 0.6))
-                    human_mouse_move(page, target)
-                    target.hover()
-                    time.sleep(random.uniform(0.4, 0.8))
-                    target.click()
-                    log("✅ Clicked on search result!")
-                    return True
+            human_mouse_move(page, target)
+            target.hover()
+            time.sleep(random.uniform(0.4, 0.8))
+            target.click()
+            log("✅ Clicked on search result!")
+            return True
         except:
-            continue
+            pass
     
     log("Could not find result to click")
     return False
 
 
-def perform_search(page, search_term, search_type="hashtag", log=print):
+def perform_search(page, search_term, search_type="hashtag", log=print, human_typing=True):
     # Click search button
     if not click_search_button(page, log):
         return False
@@ -174,13 +186,13 @@ def perform_search(page, search_term, search_type="hashtag", log=print):
         return False
     
     # Type the search term
-    if not type_search_term(page, search_term, log):
+    if not type_search_term(page, search_term, log, search_input, human_typing):
         return False
     
     # Click on result
-    return click_search_result(page, search_type, log)
+    return click_search_result(page, search_type, log, search_term)
 
-def search_instagram(cookies: list[dict], search_term, search_type="hashtag", stop_flag=None, log_callback=None, keep_open=True, headless=DEFAULT_HEADLESS, browser_type: BrowserType = DEFAULT_BROWSER):
+def search_instagram(cookies: list[dict], search_term, search_type="hashtag", stop_flag=None, log_callback=None, keep_open=True, headless=DEFAULT_HEADLESS, browser_type: BrowserType = DEFAULT_BROWSER, human_typing=True):
     def log(msg):
         if log_callback:
             log_callback(msg)
@@ -201,35 +213,34 @@ def search_instagram(cookies: list[dict], search_term, search_type="hashtag", st
     log(f"Launching {browser_type} browser...")
     
     with sync_playwright() as p:
+        # launch_with_cookies opens Instagram and returns at domcontentloaded;
+        # with a shared browser server configured, browser is a connection
+        # to it and closing it only disconnects. Media is only worth
+        # loading when the browser stays open for someone to look at.
         browser, context, page = launch_with_cookies(
             p,
             cookies,
             browser_type=browser_type,
             headless=headless,
+            shared=True,
+            block_media=not keep_open,
         )
         
         log("Browser launched successfully")
-        
-        # Navigate to Instagram
-        log("Navigating to Instagram...")
-        page.goto("https://www.instagram.com")
-        try:
-            page.wait_for_load_state('domcontentloaded', timeout=5000)
+        # The search entry point being visible is what "loaded" means here
+        if _wait_visible(page, SEARCH_BUTTON_SELECTORS, SEARCH_BUTTON_TIMEOUT_MS):
             log("✅ Instagram loaded")
-        except:
-            log("Page loading...")
-        
-        # Human-like initial wait
-        time.sleep(random.uniform(1.5, 2.5))
+        else:
+            log("⚠️ Instagram feed not ready, trying the search anyway...")
         
         # Perform search using helper functions
         log("🔍 Starting search process...")
-        if not perform_search(page, search_term, search_type, log):
+        if not perform_search(page, search_term, search_type, log, human_typing):
             log("❌ Search failed")
             context.close()
+            browser.close()
             return
         
-        time.sleep(random.uniform(2.0, 3.0))
         log(f"🎉 Search completed for: {search_term}")
         
         # Keep browser open if requested
@@ -242,6 +253,7 @@ def search_instagram(cookies: list[dict], search_term, search_type="hashtag", st
                     break
         try:
             context.close()
-            browser.close()
+            if browser:
+                browser.close()
         except:
             pass
\ No newline at end of file
@@ -11,7 +11,6 @@ import shutil
 from playwright.async_api import async_playwright
 from browser.launcher import (
     launch_persistent_async,
-    launch_browser_async,
     launch_with_cookies_async,
     get_page_async,
     BrowserType,
@@ -20,6 +19,15 @@ from browser.launcher import (
 )
 
 
+def _is_past_login(url: str) -> bool:
+    """True once the page is on Instagram but off the login and 2FA challenge pages."""
+    return (
+        "instagram.com" in url
+        and "/accounts/login" not in url
+        and "/challenge" not in url
+    )
+
+
 async def open_login_and_export_cookies(
     timeout: int = 120,
     browser_type: BrowserType = DEFAULT_BROWSER,
@@ -45,40 +53,45 @@ async def open_login_and_export_cookies(
                 browser_type=browser_type,
                 headless=False,          # always visible for manual login
                 slow_mo=500,
+                use_template=False,      # throwaway profile: not worth seeding
             )
             page = await get_page_async(context)
             await page.goto("https://www.instagram.com/accounts/login/")
 
-            # Poll for successful login — two detection methods
-            logged_in = False
-            elapsed = 0
-            poll_interval = 1  # check every second for fast response
-
-            while elapsed < timeout:
-                # Method 1: check cookies across all IG domains
-                all_cookies = await context.cookies([
-                    "https://www.instagram.com",
-                    "https://instagram.com",
-                    "https://i.instagram.com",
-                ])
-                if any(c.get("name") == "ds_user" for c in all_cookies):
-                    logged_in = True
-                    break
-
-                # Method 2: URL navigated away from login page
-                current_url = page.url
-                if (
-                    "instagram.com" in current_url
-                    and "/accounts/login" not in current_url
-                    and "/challenge" not in current_url  # skip 2FA challenge page
-                ):
-                    # Give it a moment for cookies to finalize
-                    await asyncio.sleep(2)
-                    logged_in = True
-                    break
-
-                await asyncio.sleep(poll_interval)
-                elapsed += poll_interval
+            # Wait for successful login — two detection signals, no polling
+            cookie_set = asyncio.Event()
+
+            async def on_response(response):
+                # Method 1: Instagram sets a ds_user cookie
+                if cookie_set.is_set() or "instagram.com" not in response.url:
+                    return
+                try:
+                    header = await response.header_value("set-cookie")
+                except Exception:
+                    return
+                if header and any(line.startswith("ds_user=") for line in header.split("\n")):
+                    cookie_set.set()
+
+            context.on("response", on_response)
+            # Method 2: URL navigated away from login page
+            url_left_login = asyncio.ensure_future(
+                page.wait_for_url(_is_past_login, wait_until="commit", timeout=timeout * 1000)
+            )
+            cookie_seen = asyncio.ensure_future(cookie_set.wait())
+            done, pending = await asyncio.wait(
+                {url_left_login, cookie_seen}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(url_left_login, cookie_seen, return_exceptions=True)
+
+            if url_left_login in done and not url_left_login.exception() and not cookie_set.is_set():
+                # Give cookies a moment to finalize, returning as soon as they do
+                try:
+                    await asyncio.wait_for(cookie_set.wait(), 2)
+                except asyncio.TimeoutError:
+                    pass
+            context.remove_listener("response", on_response)
 
             # Export all cookies before closing
             cookies = await context.cookies([
@@ -99,6 +112,12 @@ class CookieBrowser:
     Context manager for a browser session restored from stored cookies.
     Handles cleanup of Playwright, Browser, Context on exit.
 
+    The cookies are applied when the context is created (as its
+    ``storage_state``), and the initial navigation waits for the full
+    page (``wait_until="load"``). Sessions that only read the page can
+    pass ``wait_until="commit"`` to return as soon as it starts, and
+    ``block_media=True`` to skip downloading images, video and fonts.
+
     Usage::
 
         async with CookieBrowser(cookies) as cb:
@@ -111,11 +130,15 @@ class CookieBrowser:
         browser_type: BrowserType = DEFAULT_BROWSER,
         headless: bool = DEFAULT_HEADLESS,
         goto_url: str = "https://www.instagram.com/",
+        wait_until: str = "load",
+        block_media: bool = False,
     ):
         self.cookies = cookies
         self.browser_type = browser_type
         self.headless = headless
         self.goto_url = goto_url
+        self.wait_until = wait_until
+        self.block_media = block_media
         self._pw = None
         self._browser = None
         self.context = None
@@ -125,17 +148,18 @@ class CookieBrowser:
         from playwright.async_api import async_playwright as _ap
 
         self._pw = await _ap().start()
-        self._browser = await launch_browser_async(
+        # On a shared browser server (if configured) _browser is this
+        # session's connection to it; closing that only disconnects
+        self._browser, self.context, self.page = await launch_with_cookies_async(
             self._pw,
+            self.cookies,
             browser_type=self.browser_type,
             headless=self.headless,
+            goto_url=self.goto_url,
+            wait_until=self.wait_until,
+            shared=True,
+            block_media=self.block_media,
         )
-        self.context = await self._browser.new_context(
-            viewport={"width": 1280, "height": 720},
-        )
-        await self.context.add_cookies(self.cookies)
-        self.page = await self.context.new_page()
-        await self.page.goto(self.goto_url)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
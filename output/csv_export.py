@@ -1,55 +1,86 @@
 import csv
 import os
-from datetime import datetime
+import time
+
+
+def _row_score(r: dict) -> float:
+    try:
+        return float(r.get("score") or r.get("relevance") or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+# Target identification brain outputs classification + score; others use niche + relevance
+TARGET_ID_FIELDS = (
+    "username", "source", "target_customer", "classification", "score",
+    "signals_used", "uncertainties",
+)
+NICHE_FIELDS = ("username", "source", "target_customer", "niche", "relevance_score")
+
+
+def _row_target_id(r: dict, target_customer: str) -> tuple:
+    """One row in TARGET_ID_FIELDS order."""
+    return (
+        r.get("username", ""),
+        r.get("source", "unknown"),
+        target_customer,
+        r.get("classification", ""),
+        r.get("score", ""),
+        " | ".join(r.get("signals_used", [])),
+        " | ".join(r.get("uncertainties", [])),
+    )
+
+
+def _row_niche(r: dict, target_customer: str) -> tuple:
+    """One row in NICHE_FIELDS order."""
+    return (
+        r.get("username", ""),
+        r.get("source", "unknown"),
+        target_customer,
+        r.get("niche", ""),
+        r.get("relevance", ""),
+    )
+
+
+def _open_output(filepath: str, output_dir: str):
+    """Open *filepath* for writing, creating *output_dir* only when missing."""
+    try:
+        return open(filepath, "w", newline="", encoding="utf-8", buffering=1 << 20)
+    except FileNotFoundError:
+        os.makedirs(output_dir, exist_ok=True)
+        return open(filepath, "w", newline="", encoding="utf-8", buffering=1 << 20)
 
 
 def export_to_csv(results: list[dict], target_customer: str, output_dir: str = "output") -> str:
-    os.makedirs(output_dir, exist_ok=True)
-    
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{target_customer}_{timestamp}.csv"
-    filepath = os.path.join(output_dir, filename)
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    filepath = os.path.join(output_dir, f"{target_customer}_{timestamp}.csv")
     
-    # Target identification brain outputs classification + score; others use niche + relevance
-    use_target_id = bool(results and "classification" in results[0])
-    if use_target_id:
-        fieldnames = [
-            "username", "source", "target_customer", "classification", "score",
-            "signals_used", "uncertainties"
-        ]
+    # Schema picked once; the row loop below has no per-row branch
+    if results and "classification" in results[0]:
+        fieldnames, make_row = TARGET_ID_FIELDS, _row_target_id
     else:
-        fieldnames = ["username", "source", "target_customer", "niche", "relevance_score"]
+        fieldnames, make_row = NICHE_FIELDS, _row_niche
     
-    seen = set()
-    unique_results = []
+    # One row per (username, source), keeping the best-scored instance
+    best: dict[tuple[str, str], dict] = {}
     for r in results:
         username = r.get("username", "")
-        if username and username not in seen:
-            seen.add(username)
-            unique_results.append(r)
+        if not username:
+            continue
+        key = (username, r.get("source", "unknown"))
+        current = best.get(key)
+        if current is None or _row_score(r) > _row_score(current):
+            best[key] = r
+    unique_results = best.values()
+    
+    # Positional tuples in fieldnames order; csv.writer skips DictWriter's
+    # per-field dict lookups
+    rows = (make_row(r, target_customer) for r in unique_results)
     
-    with open(filepath, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        for r in unique_results:
-            if use_target_id:
-                writer.writerow({
-                    "username": r.get("username", ""),
-                    "source": r.get("source", "unknown"),
-                    "target_customer": target_customer,
-                    "classification": r.get("classification", ""),
-                    "score": r.get("score", ""),
-                    "signals_used": " | ".join(r.get("signals_used", [])),
-                    "uncertainties": " | ".join(r.get("uncertainties", [])),
-                })
-            else:
-                writer.writerow({
-                    "username": r.get("username", ""),
-                    "source": r.get("source", "unknown"),
-                    "target_customer": target_customer,
-                    "niche": r.get("niche", ""),
-                    "relevance_score": r.get("relevance", ""),
-                })
+    # One writerows call through a 1 MiB buffer instead of a write per row
+    with _open_output(filepath, output_dir) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(rows)
     
     return filepath
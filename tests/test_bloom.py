@@ -0,0 +1,66 @@
+import os
+
+from utils.bloom import BloomFilter
+
+
+def test_add_and_contains():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    assert "https://www.instagram.com/p/abc/" not in bloom
+    assert bloom.add("https://www.instagram.com/p/abc/") is False
+    assert "https://www.instagram.com/p/abc/" in bloom
+    assert len(bloom) == 1
+    assert bloom.dirty
+
+
+def test_add_existing_item_is_not_counted_twice():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    bloom.add("post")
+    assert bloom.add("post") is True
+    assert len(bloom) == 1
+
+
+def test_no_false_negatives():
+    bloom = BloomFilter(capacity=500, error_rate=0.01)
+    items = [f"https://www.instagram.com/p/{i}/" for i in range(500)]
+    for item in items:
+        bloom.add(item)
+    assert all(item in bloom for item in items)
+
+
+def test_save_load_round_trip(tmp_path):
+    path = str(tmp_path / "visited" / "car.bloom")
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(10):
+        bloom.add(f"post-{i}")
+    bloom.save(path)
+    assert not bloom.dirty
+    assert os.listdir(tmp_path / "visited") == ["car.bloom"]
+
+    loaded = BloomFilter.load(path, capacity=1000, error_rate=0.01)
+    assert len(loaded) == 10
+    assert all(f"post-{i}" in loaded for i in range(10))
+    assert not loaded.dirty
+
+
+def test_load_missing_file_returns_empty_filter(tmp_path):
+    loaded = BloomFilter.load(str(tmp_path / "missing.bloom"), capacity=1000, error_rate=0.01)
+    assert len(loaded) == 0
+
+
+def test_load_with_other_sizing_returns_empty_filter(tmp_path):
+    path = str(tmp_path / "car.bloom")
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    bloom.add("post")
+    bloom.save(path)
+
+    assert len(BloomFilter.load(path, capacity=2000, error_rate=0.01)) == 0
+    assert len(BloomFilter.load(path, capacity=1000, error_rate=0.001)) == 0
+
+
+def test_full():
+    bloom = BloomFilter(capacity=3, error_rate=0.01)
+    for item in ("a", "b"):
+        bloom.add(item)
+    assert not bloom.full
+    bloom.add("c")
+    assert bloom.full
@@ -0,0 +1,50 @@
+import csv
+
+from output.csv_export import NICHE_FIELDS, TARGET_ID_FIELDS, export_to_csv
+
+
+def _read(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+def test_duplicates_keep_the_best_scored_row(tmp_path):
+    results = [
+        {"username": "alice", "source": "post_owner", "classification": "target", "score": 40},
+        {"username": "alice", "source": "post_owner", "classification": "target", "score": 90},
+        {"username": "alice", "source": "post_owner", "classification": "target", "score": 70},
+    ]
+    rows = _read(export_to_csv(results, "car", output_dir=str(tmp_path)))
+
+    assert rows[0] == list(TARGET_ID_FIELDS)
+    assert len(rows) == 2
+    assert rows[1][:5] == ["alice", "post_owner", "car", "target", "90"]
+
+
+def test_same_username_from_another_source_is_kept(tmp_path):
+    results = [
+        {"username": "alice", "source": "post_owner", "niche": "cars", "relevance": 0.5},
+        {"username": "alice", "source": "commenter", "niche": "cars", "relevance": 0.8},
+    ]
+    rows = _read(export_to_csv(results, "car", output_dir=str(tmp_path)))
+
+    assert rows[0] == list(NICHE_FIELDS)
+    assert sorted(tuple(r[:2]) for r in rows[1:]) == [("alice", "commenter"), ("alice", "post_owner")]
+
+
+def test_rows_without_username_are_skipped(tmp_path):
+    results = [
+        {"username": "", "source": "post_owner", "niche": "cars", "relevance": 0.9},
+        {"source": "commenter", "niche": "cars", "relevance": 0.9},
+        {"username": "bob", "source": "commenter", "niche": "cars", "relevance": 0.1},
+    ]
+    rows = _read(export_to_csv(results, "car", output_dir=str(tmp_path)))
+
+    assert [r[0] for r in rows[1:]] == ["bob"]
+
+
+def test_missing_output_dir_is_created(tmp_path):
+    output_dir = tmp_path / "nested" / "output"
+    path = export_to_csv([], "car", output_dir=str(output_dir))
+
+    assert _read(path) == [list(NICHE_FIELDS)]
@@ -0,0 +1,53 @@
+from browser.launcher import _clean_cookies
+
+
+def _cookie(**fields):
+    return {"name": "sessionid", "value": "abc", "domain": ".instagram.com", "path": "/", **fields}
+
+
+def test_valid_cookie_is_kept_unchanged():
+    cookie = _cookie(sameSite="Lax")
+    assert _clean_cookies([cookie]) == [cookie]
+
+
+def test_cookies_playwright_would_reject_are_dropped():
+    cookies = [
+        _cookie(name=""),
+        _cookie(value=None),
+        _cookie(value=123),
+        {"name": "csrftoken", "value": "x"},  # neither url nor domain
+    ]
+    assert _clean_cookies(cookies) == []
+
+
+def test_missing_path_defaults_to_root_for_domain_cookies():
+    cookie = _cookie()
+    del cookie["path"]
+    assert _clean_cookies([cookie])[0]["path"] == "/"
+
+
+def test_url_cookie_gets_no_path():
+    cookie = {"name": "sessionid", "value": "abc", "url": "https://www.instagram.com/"}
+    assert _clean_cookies([cookie]) == [cookie]
+
+
+def test_browser_export_same_site_spellings_are_mapped():
+    cleaned = _clean_cookies([
+        _cookie(sameSite="no_restriction"),
+        _cookie(sameSite="lax"),
+        _cookie(sameSite="STRICT"),
+    ])
+    assert [c["sameSite"] for c in cleaned] == ["None", "Lax", "Strict"]
+
+
+def test_unknown_same_site_is_removed():
+    cleaned = _clean_cookies([_cookie(sameSite="unspecified")])
+    assert "sameSite" not in cleaned[0]
+
+
+def test_input_cookies_are_not_mutated():
+    cookie = _cookie(sameSite="unspecified")
+    del cookie["path"]
+    _clean_cookies([cookie])
+    assert cookie["sameSite"] == "unspecified"
+    assert "path" not in cookie
@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+pytest.importorskip("fastapi")
+models = pytest.importorskip("api.shared.models")
+
+
+@pytest.fixture(autouse=True)
+def empty_store(monkeypatch):
+    monkeypatch.setattr(models, "_store", {})
+    monkeypatch.setattr(models, "_snapshot_gen", -1)
+    monkeypatch.setattr(models, "_snapshot_bytes", b"[]")
+
+
+def test_snapshot_lists_every_task():
+    first = models.create_task("first")
+    second = models.create_task("second")
+
+    tasks = json.loads(models.list_all_tasks_bytes())
+
+    assert [t["task_id"] for t in tasks] == [first.task_id, second.task_id]
+    assert tasks[0]["status"] == "pending"
+    assert tasks[1]["message"] == "second"
+
+
+def test_snapshot_is_reused_until_a_task_changes():
+    models.create_task("job")
+
+    assert models.list_all_tasks_bytes() is models.list_all_tasks_bytes()
+
+
+def test_snapshot_is_rebuilt_after_each_mutation():
+    task = models.create_task("job")
+    before = models.list_all_tasks_bytes()
+
+    models.update_task(task.task_id, status=models.TaskStatus.RUNNING)
+    after_update = models.list_all_tasks_bytes()
+    assert after_update is not before
+    assert json.loads(after_update)[0]["status"] == "running"
+
+    models.add_task_log(task.task_id, "hello")
+    assert json.loads(models.list_all_tasks_bytes())[0]["logs"][0].endswith(" hello")
+
+    models.stop_task(task.task_id)
+    assert models.list_all_tasks_bytes() is not after_update
+
+
+def test_non_json_results_go_through_jsonable_encoder():
+    task = models.create_task("job")
+    models.update_task(task.task_id, result={"tags": {"cars"}})
+
+    assert json.loads(models.list_all_tasks_bytes())[0]["result"] == {"tags": ["cars"]}
@@ -0,0 +1,117 @@
+"""
+Bloom Filter Utility
+Fixed-size set membership for long-running sessions.
+
+Answers "have we seen this string?" with no false negatives and a tunable
+false-positive rate, in a bytearray whose size does not grow with the
+number of items added. Used for the visited-post URLs of infinite-mode
+scraper sessions, where a plain set grows without bound. Filters can be
+saved to and loaded from disk so the visited set survives between runs.
+"""
+
+import hashlib
+import math
+import os
+import struct
+import tempfile
+
+# File header: capacity, error_rate, count
+_HEADER = struct.Struct("<QdQ")
+
+
+class BloomFilter:
+    """
+    Probabilistic set of strings supporting `in`, `add` and `len`.
+
+    A false positive means an item is reported as seen when it was not;
+    for visited posts that is an occasional skipped post (~error_rate).
+    """
+
+    __slots__ = ("capacity", "error_rate", "num_bits", "num_hashes", "_bits", "_count", "dirty")
+
+    def __init__(self, capacity=50_000, error_rate=0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        # Standard sizing: m = -n ln p / (ln 2)^2, k = (m / n) ln 2
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._count = 0
+        # True when items were added since the last save/load
+        self.dirty = False
+
+    def _positions(self, item):
+        # Double hashing: two 64-bit halves of one blake2b digest give k indexes
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        m = self.num_bits
+        return [(h1 + i * h2) % m for i in range(self.num_hashes)]
+
+    def add(self, item):
+        """Add an item. Returns True if it was (probably) already present."""
+        bits = self._bits
+        present = True
+        for pos in self._positions(item):
+            byte, mask = pos >> 3, 1 << (pos & 7)
+            if not bits[byte] & mask:
+                present = False
+                bits[byte] |= mask
+        if not present:
+            self._count += 1
+            self.dirty = True
+        return present
+
+    def __contains__(self, item):
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def __len__(self):
+        """Approximate number of distinct items added."""
+        return self._count
+
+    @property
+    def full(self):
+        """True once `capacity` items were added; past that the false-positive
+        rate climbs above `error_rate`, so callers should start a new filter."""
+        return self._count >= self.capacity
+
+    def save(self, path):
+        """Write the filter to *path* (atomically, via a temp file of its own,
+        so concurrent writers of the same path never share one)."""
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER.pack(self.capacity, self.error_rate, self._count))
+                f.write(self._bits)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path, capacity=50_000, error_rate=0.001):
+        """
+        Read a filter saved with `save`. Returns an empty filter when the file
+        is missing, unreadable, or was sized for another capacity/error rate.
+        """
+        bloom = cls(capacity, error_rate)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return bloom
+        if len(data) != _HEADER.size + len(bloom._bits):
+            return bloom
+        saved_capacity, saved_error_rate, count = _HEADER.unpack_from(data)
+        if (saved_capacity, saved_error_rate) != (capacity, error_rate):
+            return bloom
+        bloom._bits[:] = data[_HEADER.size:]
+        bloom._count = count
+        return bloom